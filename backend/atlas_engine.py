@@ -2,12 +2,29 @@
 Celestial Atlas Engine - Core coordinate conversion and constellation generation
 Tower 6 - Stored. Retrievable. Kind.
 """
+from contextlib import nullcontext
 from datetime import date, datetime
-from typing import Dict, List, Tuple, Optional
-import json
+from typing import Callable, ContextManager, Dict, List, Tuple, Optional
 from pathlib import Path
-import math
 
+import numpy as np
+
+from sky_geometry import SkyIndex, angular_distance_matrix
+from star_catalog import load_star_database
+
+
+# Default phase_timer: a reusable context manager that times nothing
+_UNTIMED = nullcontext()
+
+# Length of the spiral cycle (11 solar × 13 lunar × 7 prime)
+SPIRAL_DAYS = 1001
+
+# Secondary stars are drawn from this cone around each gate anchor
+SECONDARY_RADIUS_DEG = 30.0
+
+# Valid constellation line length range (degrees)
+MIN_LINE_DEG = 10.0
+MAX_LINE_DEG = 120.0
 
 # Prime steps for Lunar Month line drawing
 PRIMES_L = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
@@ -94,16 +111,41 @@ LUNAR_PATTERNS = {
 class AtlasEngine:
     """Core engine for Celestial Atlas coordinate conversion and constellation generation"""
 
-    def __init__(self, anchor_date: date, stars_db_path: str):
+    def __init__(
+        self,
+        anchor_date: date,
+        stars_db_path: str,
+        phase_timer: Optional[Callable[[str], ContextManager]] = None,
+    ):
         self.anchor_date = anchor_date
 
-        # Load star database
-        with open(stars_db_path, 'r') as f:
-            self.stars_db = json.load(f)
-
-        self.named_stars = self.stars_db.get("named_stars", {})
-        self.bright_stars = self.stars_db.get("bright_stars", [])
-        self.gates_data = self.stars_db.get("gates", [])
+        # phase_timer(name) returns a context manager wrapped around each
+        # engine phase ("sky_address", "star_selection", "line_generation");
+        # the API plugs its metrics in here, the engine stays unaware of them
+        self.phase_timer = phase_timer or (lambda phase: _UNTIMED)
+
+        # Load star database (stars.json or a compiled stars.bin)
+        self.catalog = load_star_database(stars_db_path)
+
+        self.metadata = self.catalog.header.get("metadata", {})
+        self.named_stars = self.catalog.header.get("named_stars", {})
+        self.gates_data = self.catalog.header.get("gates", [])
+
+        # Spatial index over every bright star with a known position
+        located = np.isfinite(self.catalog.ra) & np.isfinite(self.catalog.dec)
+        self.indexed_rows = np.nonzero(located)[0]
+        self.star_index = SkyIndex(
+            self.catalog.ra[self.indexed_rows],
+            self.catalog.dec[self.indexed_rows],
+        )
+        magnitudes = self.catalog.magnitude[self.indexed_rows]
+        self.indexed_magnitudes = np.where(np.isnan(magnitudes), 99.0, magnitudes)
+        self.brightness_order = np.argsort(self.indexed_magnitudes, kind="stable").tolist()
+
+        # Precompute the date-independent payload for every spiral position;
+        # stars and lines only depend on (P, L) so they are shared
+        self._constellations: Dict[Tuple[int, int], Tuple[List[Dict], List[List[str]]]] = {}
+        self.spiral_table = [self._build_spiral_entry(K) for K in range(SPIRAL_DAYS)]
 
     def compute_sky_address(self, target_date: date) -> Tuple[int, int, int, int]:
         """
@@ -116,12 +158,47 @@ class AtlasEngine:
             - P: Prime Day (1-7)
             - K: Position in 1001-day spiral (0-1000)
         """
-        # Days from anchor
-        N = (target_date - self.anchor_date).days
+        with self.phase_timer("sky_address"):
+            # Days from anchor
+            N = (target_date - self.anchor_date).days
 
-        # Wrap into 1001-day spiral
-        K = self._mod_positive(N, 1001)
+            # Wrap into 1001-day spiral
+            K = self._mod_positive(N, SPIRAL_DAYS)
 
+            S, L, P = self.position_to_coordinate(K)
+        return S, L, P, K
+
+    def compute_sky_addresses(self, dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized compute_sky_address over many dates at once
+
+        Args:
+            dates: NumPy datetime64 array (any unit; times are floored to
+                the day) or integer proleptic ordinals as from date.toordinal()
+
+        Returns:
+            Tuple of int64 arrays (S, L, P, K), element-wise as in
+            compute_sky_address
+        """
+        with self.phase_timer("sky_address"):
+            values = np.asarray(dates)
+            if np.issubdtype(values.dtype, np.datetime64):
+                if np.isnat(values).any():
+                    raise ValueError("dates contain NaT")
+                days = values.astype("datetime64[D]").astype(np.int64)
+                N = days - np.datetime64(self.anchor_date, "D").astype(np.int64)
+            elif np.issubdtype(values.dtype, np.integer):
+                N = values.astype(np.int64) - self.anchor_date.toordinal()
+            else:
+                raise TypeError(f"Expected datetime64 or integer ordinals, got {values.dtype}")
+
+            # np.mod already returns non-negative results for a positive modulus
+            K = np.mod(N, SPIRAL_DAYS)
+            R = K % 91
+        return (K // 91) + 1, (R // 7) + 1, (R % 7) + 1, K
+
+    def position_to_coordinate(self, K: int) -> Tuple[int, int, int]:
+        """Split a spiral position K (0-1000) into its (S, L, P) coordinate"""
         # Solar Month (1-11): Each solar month = 91 days (13 lunar × 7 prime)
         S = (K // 91) + 1
 
@@ -134,7 +211,11 @@ class AtlasEngine:
         # Prime Day (1-7)
         P = (R % 7) + 1
 
-        return S, L, P, K
+        return S, L, P
+
+    def coordinate_to_position(self, S: int, L: int, P: int) -> int:
+        """Inverse of position_to_coordinate: spiral position K for (S, L, P)"""
+        return ((S - 1) * 91) + ((L - 1) * 7) + (P - 1)
 
     def _mod_positive(self, n: int, m: int) -> int:
         """Ensure modulo result is positive"""
@@ -175,26 +256,79 @@ class AtlasEngine:
                 })
 
         # Select secondary stars (brightest stars near anchors)
-        # For now, just use brightest available stars
+        anchor_hrs = {anchor.get("data", {}).get("hr") for anchor in anchors}
+        picked = self._secondary_star_indices(anchor_stars, anchor_hrs, n_secondary)
+
         secondary_stars = []
-        for star in self.bright_stars[:n_secondary]:
-            if star.get("ra") is not None and star.get("dec") is not None:
-                secondary_stars.append({
-                    "id": f"HR{star.get('hr', 0)}",
-                    "name": star.get("name") or f"HR{star.get('hr', 0)}",
-                    "ra": star["ra"],
-                    "dec": star["dec"],
-                    "magnitude": star["magnitude"],
-                    "is_anchor": False
-                })
+        for i in picked:
+            star = self.catalog.star(self.indexed_rows[i])
+            secondary_stars.append({
+                "id": f"HR{star['hr']}",
+                "name": star["name"] or f"HR{star['hr']}",
+                "ra": star["ra"],
+                "dec": star["dec"],
+                "magnitude": star["magnitude"],
+                "is_anchor": False
+            })
 
         return anchor_stars + secondary_stars
 
-    def generate_constellation_lines(self, stars: List[Dict], lunar_month: int) -> List[Tuple[str, str]]:
+    def _secondary_star_indices(self, anchor_stars: List[Dict], anchor_hrs: set, count: int) -> List[int]:
+        """
+        Pick indexed stars to support the anchors
+
+        Each anchor contributes the brightest stars within SECONDARY_RADIUS_DEG,
+        taken round-robin so every anchor gets company. Sparse regions are
+        topped up with the nearest stars, and gates without anchors fall
+        back to the brightest stars in the sky.
+        """
+        def usable(i: int) -> bool:
+            return i not in chosen and int(self.catalog.hr[self.indexed_rows[i]]) not in anchor_hrs
+
+        chosen: List[int] = []
+
+        if not anchor_stars:
+            for i in self.brightness_order:
+                if len(chosen) >= count:
+                    break
+                if usable(i):
+                    chosen.append(i)
+            return chosen
+
+        # Brightest neighbours per anchor
+        per_anchor = []
+        for anchor in anchor_stars:
+            nearby = self.star_index.query_radius(anchor["ra"], anchor["dec"], SECONDARY_RADIUS_DEG)
+            nearby.sort(key=lambda hit: self.indexed_magnitudes[hit[0]])
+            per_anchor.append([i for i, _ in nearby])
+
+        depth = 0
+        while len(chosen) < count and any(depth < len(c) for c in per_anchor):
+            for candidates in per_anchor:
+                if len(chosen) >= count:
+                    break
+                if depth < len(candidates) and usable(candidates[depth]):
+                    chosen.append(candidates[depth])
+            depth += 1
+
+        # Top up with the closest stars if the cones were too sparse
+        if len(chosen) < count:
+            k = count + len(anchor_hrs) + len(chosen)
+            for anchor in anchor_stars:
+                for i, _ in self.star_index.query_nearest(anchor["ra"], anchor["dec"], k):
+                    if len(chosen) >= count:
+                        break
+                    if usable(i):
+                        chosen.append(i)
+
+        return chosen
+
+    def generate_constellation_lines(self, stars: List[Dict], lunar_month: int) -> List[List[str]]:
         """
         Generate constellation lines using prime-step algorithm
 
-        The prime step for each lunar month determines the connection pattern
+        The prime step for each lunar month determines the connection pattern.
+        Lines are [star_id_a, star_id_b] lists so payloads serialize as-is.
         """
         if len(stars) < 2:
             return []
@@ -202,49 +336,24 @@ class AtlasEngine:
         # Get prime step for this lunar month
         step = PRIMES_L[lunar_month - 1]
 
-        lines = []
-        n = len(stars)
+        # Angular separation of every star pair in one matrix operation
+        distances = angular_distance_matrix(
+            [star.get("ra", 0) for star in stars],
+            [star.get("dec", 0) for star in stars],
+        )
 
-        # Connect stars using prime step
+        # Connect stars using prime step, keeping only connections that are
+        # not too short/long
+        n = len(stars)
+        lines = []
         for i in range(n):
             j = (i + step) % n
-            star_a = stars[i]
-            star_b = stars[j]
-
-            # Calculate angular distance to filter out invalid connections
-            if self._valid_connection(star_a, star_b):
-                lines.append((star_a["id"], star_b["id"]))
+            if MIN_LINE_DEG <= distances[i, j] <= MAX_LINE_DEG:
+                lines.append([stars[i]["id"], stars[j]["id"]])
 
         # Limit to max 18 lines (sacred clarity)
         return lines[:18]
 
-    def _valid_connection(self, star_a: Dict, star_b: Dict) -> bool:
-        """Check if connection between two stars is valid (not too short/long)"""
-        ra1, dec1 = star_a.get("ra", 0), star_a.get("dec", 0)
-        ra2, dec2 = star_b.get("ra", 0), star_b.get("dec", 0)
-
-        # Calculate angular distance
-        angular_dist = self._angular_distance(ra1, dec1, ra2, dec2)
-
-        # Valid range: 10° to 120°
-        return 10 <= angular_dist <= 120
-
-    def _angular_distance(self, ra1: float, dec1: float, ra2: float, dec2: float) -> float:
-        """Calculate angular distance between two celestial coordinates (in degrees)"""
-        ra1_rad = math.radians(ra1)
-        dec1_rad = math.radians(dec1)
-        ra2_rad = math.radians(ra2)
-        dec2_rad = math.radians(dec2)
-
-        # Haversine formula
-        dra = ra2_rad - ra1_rad
-        ddec = dec2_rad - dec1_rad
-
-        a = math.sin(ddec/2)**2 + math.cos(dec1_rad) * math.cos(dec2_rad) * math.sin(dra/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-
-        return math.degrees(c)
-
     def generate_atlas_payload(self, target_date: date) -> Dict:
         """
         Generate complete Atlas payload for a given date
@@ -255,27 +364,104 @@ class AtlasEngine:
         - Stars and Lines
         - Message and Thread
         """
-        # Compute sky address
-        S, L, P, K = self.compute_sky_address(target_date)
+        K = self.compute_sky_address(target_date)[3]
+        return self.payload_for_position(K, target_date.isoformat())
+
+    def payload_for_position(self, K: int, date_str: Optional[str]) -> Dict:
+        """
+        Build an Atlas payload from the precomputed spiral table
+
+        Only the date field is filled in per call; the nested gate, star
+        and line data is shared with the table and must be treated as
+        read-only.
+        """
+        return {"date": date_str, **self.spiral_table[K]}
+
+    def generate_coordinate_payload(self, S: int, L: int, P: int) -> Dict:
+        """
+        Atlas payload for browsing by Sky Address rather than by date
+
+        The date is None and the S/L/P shorthand keys are appended for the
+        frontend.
+        """
+        payload = self.payload_for_position(self.coordinate_to_position(S, L, P), None)
+
+        # Add shorthand keys for frontend
+        payload["S"] = S
+        payload["L"] = L
+        payload["P"] = P
+
+        return payload
+
+    def gates_document(self) -> Dict:
+        """All 7 Spiral Gate definitions with their anchor star names"""
+        gates_list = []
+        for gate_id, gate_data in GATES.items():
+            anchors = self.get_gate_anchors(gate_id)
+            gates_list.append({
+                "id": gate_id,
+                **gate_data,
+                "anchors": [a["name"] for a in anchors]
+            })
+        return {
+            "gates": gates_list,
+            "seal": "Stored. Retrievable. Kind."
+        }
+
+    def solar_keys_document(self) -> Dict:
+        """All 11 Solar Key Signatures"""
+        keys_list = []
+        for key_id, key_data in SOLAR_KEYS.items():
+            keys_list.append({
+                "id": key_id,
+                **key_data
+            })
+        return {
+            "solar_keys": keys_list,
+            "seal": "Stored. Retrievable. Kind."
+        }
+
+    def lunar_patterns_document(self) -> Dict:
+        """All 13 Lunar Pattern Types with their prime steps"""
+        patterns_list = []
+        for pattern_id, pattern_data in LUNAR_PATTERNS.items():
+            patterns_list.append({
+                "id": pattern_id,
+                **pattern_data,
+                "prime_step": PRIMES_L[pattern_id - 1]
+            })
+        return {
+            "lunar_patterns": patterns_list,
+            "seal": "Stored. Retrievable. Kind."
+        }
+
+    def _build_spiral_entry(self, K: int) -> Dict:
+        """Build the date-independent part of the payload for spiral position K"""
+        S, L, P = self.position_to_coordinate(K)
 
         # Get gate info
         gate = GATES[P]
         solar_key = SOLAR_KEYS[S]
         lunar_pattern = LUNAR_PATTERNS[L]
 
-        # Select stars
-        stars = self.select_stars_for_gate(P, L)
+        if (P, L) not in self._constellations:
+            # Select stars
+            with self.phase_timer("star_selection"):
+                stars = self.select_stars_for_gate(P, L)
 
-        # Generate lines
-        lines = self.generate_constellation_lines(stars, L)
+            # Generate lines
+            with self.phase_timer("line_generation"):
+                lines = self.generate_constellation_lines(stars, L)
+
+            self._constellations[(P, L)] = (stars, lines)
+        stars, lines = self._constellations[(P, L)]
 
         # Generate message and thread
         message = self._generate_message(gate, solar_key, lunar_pattern)
         thread = self._generate_noble_thread(gate, lunar_pattern)
 
-        # Build payload
-        payload = {
-            "date": target_date.isoformat(),
+        # Build payload (the date is prepended by payload_for_position)
+        return {
             "anchor_date": self.anchor_date.isoformat(),
             "K": K,
             "sky_address": f"{S}•{L}•{P}",
@@ -302,7 +488,7 @@ class AtlasEngine:
                 "mood": solar_key["mood"]
             },
             "stars_highlighted": stars,
-            "lines": [[a, b] for a, b in lines],
+            "lines": lines,
             "render": {
                 "intensity": 0.8,
                 "max_stars": 12,
@@ -315,8 +501,6 @@ class AtlasEngine:
             "seal": "Stored. Retrievable. Kind."
         }
 
-        return payload
-
     def _generate_message(self, gate: Dict, solar_key: Dict, lunar_pattern: Dict) -> str:
         """Generate contextual message based on gate, key, and pattern"""
         messages = {
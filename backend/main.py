@@ -2,14 +2,33 @@
 Celestial Atlas API - FastAPI Backend
 Tower 6 - Stored. Retrievable. Kind.
 """
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Iterator, List, NamedTuple, Optional
+import hashlib
+import json
 import os
+import re
+import time
+import numpy as np
 from dotenv import load_dotenv
 
-from atlas_engine import AtlasEngine, GATES, SOLAR_KEYS, LUNAR_PATTERNS, PRIMES_L
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+from atlas_engine import AtlasEngine, GATES, SPIRAL_DAYS
+from metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    PHASE_BUCKETS,
+    PhaseTimer,
+    Registry,
+    RequestMetricsMiddleware,
+)
 
 # Load environment variables
 load_dotenv()
@@ -18,11 +37,54 @@ ANCHOR_DATE_STR = os.getenv("ANCHOR_DATE", "2025-04-03")
 ANCHOR_DATE = datetime.strptime(ANCHOR_DATE_STR, "%Y-%m-%d").date()
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 
+# Prefer the compiled, memory-mapped catalog when it has been built
+STARS_DB_PATH = os.getenv("STARS_DB_PATH") or (
+    "stars.bin" if os.path.exists("stars.bin") else "stars.json"
+)
+
+
+class AtlasJSONResponse(JSONResponse):
+    """
+    JSON response rendered by encode_json (orjson when available)
+
+    Routes return this directly so FastAPI skips jsonable_encoder; the
+    engine only emits plain dicts, lists, strings and numbers.
+    """
+
+    def render(self, content) -> bytes:
+        return encode_json(content)
+
+
+# ===== METRICS =====
+
+metrics = Registry()
+REQUESTS_TOTAL = metrics.counter(
+    "atlas_http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+REQUEST_DURATION = metrics.histogram(
+    "atlas_http_request_duration_seconds",
+    "HTTP request latency, until the last body byte is sent",
+    ("method", "route"),
+)
+REQUESTS_IN_FLIGHT = metrics.gauge("atlas_http_requests_in_flight", "HTTP requests being handled")
+ENGINE_PHASE_DURATION = metrics.histogram(
+    "atlas_engine_phase_seconds",
+    "Time spent per engine phase (sky_address, star_selection, line_generation, serialization)",
+    ("phase",),
+    buckets=PHASE_BUCKETS,
+)
+ENGINE_STARTUP = metrics.gauge(
+    "atlas_engine_startup_seconds", "Time to load the catalog and precompute the spiral"
+)
+PHASE_TIMER = PhaseTimer(ENGINE_PHASE_DURATION)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Celestial Atlas API",
     description="Tower 6 Celestial Atlas - Prime Calendar & Star Mapping System",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=AtlasJSONResponse
 )
 
 # Add CORS middleware
@@ -34,24 +96,145 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost middleware, so timings include CORS handling
+app.add_middleware(
+    RequestMetricsMiddleware,
+    requests_total=REQUESTS_TOTAL,
+    request_duration=REQUEST_DURATION,
+    requests_in_flight=REQUESTS_IN_FLIGHT,
+)
+
 # Initialize Atlas Engine
-engine = AtlasEngine(anchor_date=ANCHOR_DATE, stars_db_path="stars.json")
+_engine_start = time.perf_counter()
+engine = AtlasEngine(anchor_date=ANCHOR_DATE, stars_db_path=STARS_DB_PATH, phase_timer=PHASE_TIMER)
+ENGINE_STARTUP.set(time.perf_counter() - _engine_start)
+
+# Cache-Control policies: a dated payload never changes for a given engine,
+# while /atlas/today must be revalidated so clients pick up the new day
+CACHE_DATED = "public, max-age=86400"
+CACHE_TODAY = "no-cache"
+CACHE_STATIC = "public, max-age=86400"
+
+# Longest span /atlas/range will stream in one response (ten full spirals)
+MAX_RANGE_DAYS = 10 * SPIRAL_DAYS
+
+# Most items a single POST /atlas/batch may resolve
+MAX_BATCH_ITEMS = 1000
+
+# Most dates a single POST /atlas/convert may convert
+MAX_CONVERT_DATES = 100_000
+
+# Top-level payload keys that /atlas/range can project onto
+PAYLOAD_FIELDS = list(engine.payload_for_position(0, None).keys())
+
+
+# ===== PRE-ENCODED RESPONSES =====
+
+class EncodedBody(NamedTuple):
+    """Final JSON bytes for a response together with its strong ETag"""
+    body: bytes
+    etag: str
+
+
+def encode_json(content) -> bytes:
+    """Encode content to compact UTF-8 JSON, using orjson when installed"""
+    with PHASE_TIMER("serialization"):
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def _encode_body(content) -> EncodedBody:
+    body = encode_json(content)
+    return EncodedBody(body, f'"{_digest(body)}"')
+
+
+def _encode_position(K: int) -> EncodedBody:
+    """
+    Encode the spiral table entry for K without its opening brace
+
+    Dated payloads are produced by splicing the date field in front of
+    these bytes, so the per-request work is a single concatenation.
+    """
+    body = encode_json(engine.spiral_table[K])
+    return EncodedBody(body[1:], _digest(body))
+
+
+def _encode_coordinate(K: int) -> EncodedBody:
+    """Encode the /atlas/coordinate document for K"""
+    return _encode_body(engine.generate_coordinate_payload(*engine.position_to_coordinate(K)))
+
+
+POSITION_BODIES = [_encode_position(K) for K in range(len(engine.spiral_table))]
+COORDINATE_BODIES = [_encode_coordinate(K) for K in range(len(engine.spiral_table))]
+GATES_BODY = _encode_body(engine.gates_document())
+SOLAR_KEYS_BODY = _encode_body(engine.solar_keys_document())
+LUNAR_PATTERNS_BODY = _encode_body(engine.lunar_patterns_document())
+
+
+def dated_payload_body(K: int, date_str: str) -> EncodedBody:
+    """Encoded Atlas payload for spiral position K on the given date"""
+    cached = POSITION_BODIES[K]
+    body = b'{"date":' + encode_json(date_str) + b"," + cached.body
+    return EncodedBody(body, f'"{cached.etag}-{date_str}"')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cached_response(request: Request, encoded: EncodedBody, cache_control: str) -> Response:
+    """Serve pre-encoded JSON, answering a matching If-None-Match with 304"""
+    headers = {"ETag": encoded.etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Request and engine metrics in the Prometheus text format"""
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 @app.get("/")
 def root():
     """Health check and API info"""
-    return {
+    return AtlasJSONResponse({
         "name": "Celestial Atlas API",
         "version": "1.0.0",
         "anchor_date": ANCHOR_DATE.isoformat(),
         "seal": "Stored. Retrievable. Kind.",
         "tower": "Tower 6 forever."
-    }
+    })
 
 
 @app.get("/atlas")
-def get_atlas(date_str: str = Query(..., alias="date", description="Date in YYYY-MM-DD format")):
+def get_atlas(
+    request: Request,
+    date_str: str = Query(..., alias="date", description="Date in YYYY-MM-DD format")
+):
     """
     Get complete Atlas payload for a specific date
 
@@ -66,20 +249,21 @@ def get_atlas(date_str: str = Query(..., alias="date", description="Date in YYYY
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-    payload = engine.generate_atlas_payload(target_date)
-    return payload
+    K = engine.compute_sky_address(target_date)[3]
+    return cached_response(request, dated_payload_body(K, target_date.isoformat()), CACHE_DATED)
 
 
 @app.get("/atlas/today")
-def get_atlas_today():
+def get_atlas_today(request: Request):
     """Get Atlas payload for today"""
     today = date.today()
-    payload = engine.generate_atlas_payload(today)
-    return payload
+    K = engine.compute_sky_address(today)[3]
+    return cached_response(request, dated_payload_body(K, today.isoformat()), CACHE_TODAY)
 
 
 @app.get("/atlas/coordinate")
 def get_atlas_by_coordinate(
+    request: Request,
     S: int = Query(..., ge=1, le=11, description="Solar Month (1-11)"),
     L: int = Query(..., ge=1, le=13, description="Lunar Month (1-13)"),
     P: int = Query(..., ge=1, le=7, description="Prime Day (1-7)")
@@ -93,73 +277,143 @@ def get_atlas_by_coordinate(
     if not gate:
         raise HTTPException(status_code=400, detail="Invalid Prime Day")
 
-    # Calculate K from coordinates and generate a date that matches
-    K = ((S - 1) * 91) + ((L - 1) * 7) + (P - 1)
+    # Look up the spiral position directly; no date is involved when
+    # browsing by coordinate
+    K = engine.coordinate_to_position(S, L, P)
+    return cached_response(request, COORDINATE_BODIES[K], CACHE_DATED)
+
+
+def _parse_date_param(value: str, name: str) -> date:
+    """Parse a YYYY-MM-DD query parameter or fail with 400"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} format. Use YYYY-MM-DD")
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated field projection, rejecting unknown keys"""
+    if not fields:
+        return None
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in PAYLOAD_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Valid fields: {', '.join(PAYLOAD_FIELDS)}"
+        )
+    return selected
+
+
+def _iter_range_lines(start: date, days: int, fields: Optional[List[str]]) -> Iterator[bytes]:
+    """Yield one encoded payload per day as NDJSON lines"""
+    for offset in range(days):
+        target_date = start + timedelta(days=offset)
+        if fields is None:
+            K = engine.compute_sky_address(target_date)[3]
+            yield dated_payload_body(K, target_date.isoformat()).body + b"\n"
+        else:
+            payload = engine.generate_atlas_payload(target_date)
+            yield encode_json({f: payload[f] for f in fields}) + b"\n"
+
+
+@app.get("/atlas/range")
+def get_atlas_range(
+    start: str = Query(..., description="First date in YYYY-MM-DD format"),
+    end: str = Query(..., description="Last date (inclusive) in YYYY-MM-DD format"),
+    fields: Optional[str] = Query(None, description="Comma-separated payload keys to include")
+):
+    """
+    Stream Atlas payloads for every date in [start, end] as NDJSON
+
+    One JSON document per line, produced lazily so memory stays flat and
+    the first day is sent immediately. Use `fields` to project each
+    payload onto a subset of keys (e.g. `date,sky_address,gate`).
+    """
+    start_date = _parse_date_param(start, "start")
+    end_date = _parse_date_param(end, "end")
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+
+    days = (end_date - start_date).days + 1
+    if days > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range too long: max {MAX_RANGE_DAYS} days")
+
+    selected = _parse_fields(fields)
+    return StreamingResponse(
+        _iter_range_lines(start_date, days, selected),
+        media_type="application/x-ndjson",
+    )
+
+
+class BatchItem(BaseModel):
+    """One batch entry: either a date or a full S•L•P coordinate"""
+    date: Optional[str] = Field(None, description="Date in YYYY-MM-DD format")
+    S: Optional[int] = Field(None, ge=1, le=11, description="Solar Month (1-11)")
+    L: Optional[int] = Field(None, ge=1, le=13, description="Lunar Month (1-13)")
+    P: Optional[int] = Field(None, ge=1, le=7, description="Prime Day (1-7)")
 
-    # Calculate a date for this coordinate (days from anchor date)
-    anchor_date = date(2025, 4, 3)
-    target_date = anchor_date + timedelta(days=K)
 
-    # Generate full payload using the engine
-    payload = engine.generate_atlas_payload(target_date)
+class BatchRequest(BaseModel):
+    items: List[BatchItem] = Field(..., max_length=MAX_BATCH_ITEMS)
 
-    # Override date to None since we're browsing by coordinate, not date
-    payload["date"] = None
 
-    # Add shorthand keys for frontend
-    payload["S"] = S
-    payload["L"] = L
-    payload["P"] = P
+@app.post("/atlas/batch")
+def post_atlas_batch(batch: BatchRequest):
+    """
+    Resolve many dates and/or S•L•P coordinates in one round trip
 
-    return payload
+    Items are mapped to spiral positions first, so entries sharing a K
+    reuse one encoded payload. Results come back in request order: dated
+    items as /atlas payloads, coordinate items as /atlas/coordinate ones.
+    """
+    resolved = []  # (K, date string or None) per item
+    for i, item in enumerate(batch.items):
+        coordinate = (item.S, item.L, item.P)
+        if item.date is not None and all(c is None for c in coordinate):
+            target_date = _parse_date_param(item.date, f"items[{i}].date")
+            resolved.append((engine.compute_sky_address(target_date)[3], target_date.isoformat()))
+        elif item.date is None and all(c is not None for c in coordinate):
+            resolved.append((engine.coordinate_to_position(*coordinate), None))
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail=f"items[{i}] must have either a date or all of S, L and P"
+            )
+
+    # Each distinct spiral position maps to one pre-encoded body that is
+    # spliced into every item sharing it
+    positions = {K for K, _ in resolved}
+    results = [
+        dated_payload_body(K, date_str).body if date_str else COORDINATE_BODIES[K].body
+        for K, date_str in resolved
+    ]
+
+    body = (
+        b'{"count":' + encode_json(len(results))
+        + b',"unique_positions":' + encode_json(len(positions))
+        + b',"results":[' + b",".join(results) + b"]"
+        + b',"seal":' + encode_json("Stored. Retrievable. Kind.") + b"}"
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/atlas/gates")
-def get_gates():
+def get_gates(request: Request):
     """Get all 7 Spiral Gate definitions"""
-    gates_list = []
-    for gate_id, gate_data in GATES.items():
-        anchors = engine.get_gate_anchors(gate_id)
-        gates_list.append({
-            "id": gate_id,
-            **gate_data,
-            "anchors": [a["name"] for a in anchors]
-        })
-    return {
-        "gates": gates_list,
-        "seal": "Stored. Retrievable. Kind."
-    }
+    return cached_response(request, GATES_BODY, CACHE_STATIC)
 
 
 @app.get("/atlas/keys")
-def get_solar_keys():
+def get_solar_keys(request: Request):
     """Get all 11 Solar Key Signatures"""
-    keys_list = []
-    for key_id, key_data in SOLAR_KEYS.items():
-        keys_list.append({
-            "id": key_id,
-            **key_data
-        })
-    return {
-        "solar_keys": keys_list,
-        "seal": "Stored. Retrievable. Kind."
-    }
+    return cached_response(request, SOLAR_KEYS_BODY, CACHE_STATIC)
 
 
 @app.get("/atlas/patterns")
-def get_lunar_patterns():
+def get_lunar_patterns(request: Request):
     """Get all 13 Lunar Pattern Types"""
-    patterns_list = []
-    for pattern_id, pattern_data in LUNAR_PATTERNS.items():
-        patterns_list.append({
-            "id": pattern_id,
-            **pattern_data,
-            "prime_step": PRIMES_L[pattern_id - 1]
-        })
-    return {
-        "lunar_patterns": patterns_list,
-        "seal": "Stored. Retrievable. Kind."
-    }
+    return cached_response(request, LUNAR_PATTERNS_BODY, CACHE_STATIC)
 
 
 @app.get("/atlas/convert")
@@ -176,7 +430,7 @@ def convert_date_to_sky_address(date_str: str = Query(..., alias="date")):
 
     S, L, P, K = engine.compute_sky_address(target_date)
 
-    return {
+    return AtlasJSONResponse({
         "date": target_date.isoformat(),
         "sky_address": f"{S}•{L}•{P}",
         "solar_month": S,
@@ -185,7 +439,54 @@ def convert_date_to_sky_address(date_str: str = Query(..., alias="date")):
         "K": K,
         "spiral_position": f"{K}/1001",
         "seal": "Stored. Retrievable. Kind."
-    }
+    })
+
+
+# NumPy's datetime64 parser also takes "today", "2026-01", times and
+# signed years; batch dates must be exactly YYYY-MM-DD
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+
+class ConvertBatchRequest(BaseModel):
+    dates: List[str] = Field(..., max_length=MAX_CONVERT_DATES)
+
+
+@app.post("/atlas/convert")
+def convert_dates_to_sky_addresses(batch: ConvertBatchRequest):
+    """
+    Convert many dates to Sky Address coordinates in one vectorized pass
+
+    Returns column arrays aligned with the request's `dates` list, which
+    keeps the response compact for large analytics batches.
+    """
+    for i, value in enumerate(batch.dates):
+        if not ISO_DATE.fullmatch(value):
+            raise HTTPException(status_code=400, detail=f"dates[{i}]: invalid date format. Use YYYY-MM-DD")
+
+    try:
+        dates = np.array(batch.dates, dtype="datetime64[D]")
+    except ValueError:
+        # Well-formed but not a calendar date (e.g. 2026-02-30); find which
+        for i, value in enumerate(batch.dates):
+            try:
+                date.fromisoformat(value)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"dates[{i}]: invalid date {value}")
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    try:
+        S, L, P, K = engine.compute_sky_addresses(dates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return AtlasJSONResponse({
+        "count": len(dates),
+        "solar_month": S.tolist(),
+        "lunar_month": L.tolist(),
+        "prime_day": P.tolist(),
+        "K": K.tolist(),
+        "seal": "Stored. Retrievable. Kind."
+    })
 
 
 if __name__ == "__main__":
@@ -18,6 +18,10 @@ source venv/bin/activate
 echo "Installing dependencies..."
 pip install -q -r requirements.txt
 
+# Compile the memory-mapped star catalog
+echo "Compiling star catalog..."
+python3 star_catalog.py stars.json stars.bin
+
 echo ""
 echo "Starting Atlas API server..."
 echo "Anchor Date: April 3, 2025"
@@ -0,0 +1,182 @@
+"""
+Sky Geometry - Spherical distances and lookups over the star catalog
+Tower 6 - Stored. Retrievable. Kind.
+"""
+import heapq
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+def radec_to_unit_vectors(ra: Sequence[float], dec: Sequence[float]) -> np.ndarray:
+    """Convert RA/Dec in degrees to an (n, 3) array of unit vectors"""
+    ra_rad = np.radians(np.asarray(ra, dtype=np.float64))
+    dec_rad = np.radians(np.asarray(dec, dtype=np.float64))
+    cos_dec = np.cos(dec_rad)
+    return np.column_stack((cos_dec * np.cos(ra_rad), cos_dec * np.sin(ra_rad), np.sin(dec_rad)))
+
+
+def angle_to_chord(angle_deg: float) -> float:
+    """Straight-line distance between two unit vectors separated by angle_deg"""
+    return 2.0 * math.sin(math.radians(min(angle_deg, 180.0)) / 2.0)
+
+
+def chords_to_angles(chords: np.ndarray) -> np.ndarray:
+    """Inverse of angle_to_chord for an array of chord lengths (degrees)"""
+    return np.degrees(2.0 * np.arcsin(np.clip(chords / 2.0, 0.0, 1.0)))
+
+
+def angular_distance_matrix(ra: Sequence[float], dec: Sequence[float]) -> np.ndarray:
+    """
+    Pairwise angular separations (degrees) between n sky positions
+
+    Uses atan2(|a × b|, a · b), which stays accurate for both tiny and
+    near-antipodal separations, as a single (n, n) array operation.
+    """
+    vectors = radec_to_unit_vectors(ra, dec)
+    dots = np.clip(vectors @ vectors.T, -1.0, 1.0)
+    crosses = np.linalg.norm(np.cross(vectors[:, None, :], vectors[None, :, :]), axis=-1)
+    return np.degrees(np.arctan2(crosses, dots))
+
+
+class SkyIndex:
+    """
+    k-d tree over catalog stars as unit vectors on the celestial sphere
+
+    Chord length between unit vectors grows monotonically with angular
+    separation, so nearest-neighbour and radius queries in 3D space give
+    exact answers on the sphere without any RA wrap-around handling.
+    """
+
+    LEAF_SIZE = 16
+
+    def __init__(self, ra: Sequence[float], dec: Sequence[float]):
+        self.vectors = radec_to_unit_vectors(ra, dec)
+        self.order = np.arange(len(self.vectors))
+
+        # Flat node arrays: [start, end) slice of self.order, children and
+        # bounding box per node; leaves have no children (-1)
+        self._start: List[int] = []
+        self._end: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._box_lo: List[np.ndarray] = []
+        self._box_hi: List[np.ndarray] = []
+
+        if len(self.vectors):
+            self._build()
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def _new_node(self, start: int, end: int) -> int:
+        points = self.vectors[self.order[start:end]]
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._box_lo.append(points.min(axis=0))
+        self._box_hi.append(points.max(axis=0))
+        return len(self._start) - 1
+
+    def _build(self) -> None:
+        """Recursively split on the widest axis at the median"""
+        stack = [self._new_node(0, len(self.vectors))]
+        while stack:
+            node = stack.pop()
+            start, end = self._start[node], self._end[node]
+            if end - start <= self.LEAF_SIZE:
+                continue
+
+            axis = int(np.argmax(self._box_hi[node] - self._box_lo[node]))
+            segment = self.order[start:end]
+            mid = (end - start) // 2
+            partition = np.argpartition(self.vectors[segment, axis], mid)
+            self.order[start:end] = segment[partition]
+
+            self._left[node] = self._new_node(start, start + mid)
+            self._right[node] = self._new_node(start + mid, end)
+            stack.extend((self._left[node], self._right[node]))
+
+    def _box_distance(self, node: int, point: np.ndarray) -> float:
+        """Lower bound on the chord from point to anything inside node"""
+        gap = np.maximum(self._box_lo[node] - point, 0.0) + np.maximum(point - self._box_hi[node], 0.0)
+        return float(np.sqrt(gap @ gap))
+
+    def _leaf_chords(self, node: int, point: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        idx = self.order[self._start[node]:self._end[node]]
+        diff = self.vectors[idx] - point
+        return idx, np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+    def query_nearest(self, ra: float, dec: float, k: int) -> List[Tuple[int, float]]:
+        """
+        Find the k catalog stars closest to (ra, dec)
+
+        Returns:
+            List of (catalog index, angular distance in degrees), nearest first
+        """
+        if k <= 0 or not len(self.vectors):
+            return []
+
+        point = radec_to_unit_vectors([ra], [dec])[0]
+        best: List[Tuple[float, int]] = []  # max-heap of (-chord, index)
+        frontier = [(0.0, 0)]
+
+        while frontier:
+            bound, node = heapq.heappop(frontier)
+            if len(best) == k and bound > -best[0][0]:
+                break
+
+            if self._left[node] < 0:
+                idx, chords = self._leaf_chords(node, point)
+                for i, chord in zip(idx.tolist(), chords.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-chord, i))
+                    elif chord < -best[0][0]:
+                        heapq.heapreplace(best, (-chord, i))
+                continue
+
+            for child in (self._left[node], self._right[node]):
+                heapq.heappush(frontier, (self._box_distance(child, point), child))
+
+        best.sort(key=lambda item: -item[0])
+        chords = np.array([-c for c, _ in best])
+        angles = chords_to_angles(chords).tolist()
+        return [(i, angle) for (_, i), angle in zip(best, angles)]
+
+    def query_radius(self, ra: float, dec: float, radius_deg: float) -> List[Tuple[int, float]]:
+        """
+        Find every catalog star within radius_deg of (ra, dec)
+
+        Returns:
+            List of (catalog index, angular distance in degrees), nearest first
+        """
+        if not len(self.vectors):
+            return []
+
+        point = radec_to_unit_vectors([ra], [dec])[0]
+        limit = angle_to_chord(radius_deg)
+        hits_idx: List[np.ndarray] = []
+        hits_chord: List[np.ndarray] = []
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, point) > limit:
+                continue
+            if self._left[node] < 0:
+                idx, chords = self._leaf_chords(node, point)
+                inside = chords <= limit
+                hits_idx.append(idx[inside])
+                hits_chord.append(chords[inside])
+            else:
+                stack.extend((self._left[node], self._right[node]))
+
+        if not hits_idx:
+            return []
+
+        idx = np.concatenate(hits_idx)
+        chords = np.concatenate(hits_chord)
+        ranked = np.argsort(chords, kind="stable")
+        return list(zip(idx[ranked].tolist(), chords_to_angles(chords[ranked]).tolist()))
@@ -0,0 +1,205 @@
+"""
+Star Catalog - Columnar star storage with a memory-mapped binary format
+Tower 6 - Stored. Retrievable. Kind.
+
+Compile stars.json once with:
+
+    python star_catalog.py stars.json stars.bin
+
+The binary file holds the small JSON sections (metadata, gates, named
+stars) in a header, followed by one packed array per bright-star column.
+Loading it maps the file instead of parsing it, so uvicorn workers share
+the catalog pages through the OS page cache.
+"""
+from typing import Dict, List, Optional, Sequence
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+MAGIC = b"ATLSCAT1"
+ALIGN = 8
+
+# Numeric columns and their on-disk dtypes
+NUMERIC_COLUMNS = {
+    "ra": "<f8",
+    "dec": "<f8",
+    "magnitude": "<f8",
+    "hr": "<i4",
+}
+
+# String columns are stored as a uint32 offset array plus a UTF-8 blob
+STRING_COLUMNS = ("name", "spectral_type")
+
+
+def _pad(n: int) -> int:
+    return (-n) % ALIGN
+
+
+class StarCatalog:
+    """Bright stars held as parallel arrays instead of one dict per star"""
+
+    def __init__(
+        self,
+        ra: np.ndarray,
+        dec: np.ndarray,
+        magnitude: np.ndarray,
+        hr: np.ndarray,
+        strings: Dict[str, "StringTable"],
+        header: Optional[Dict] = None,
+    ):
+        self.ra = ra
+        self.dec = dec
+        self.magnitude = magnitude
+        self.hr = hr
+        self.strings = strings
+        self.header = header or {}
+
+    def __len__(self) -> int:
+        return len(self.ra)
+
+    @classmethod
+    def from_stars(cls, stars: Sequence[Dict], header: Optional[Dict] = None) -> "StarCatalog":
+        """Build a catalog from star dicts as found in stars.json"""
+        def floats(key: str) -> np.ndarray:
+            values = [star.get(key) for star in stars]
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        return cls(
+            ra=floats("ra"),
+            dec=floats("dec"),
+            magnitude=floats("magnitude"),
+            hr=np.array([star.get("hr") or 0 for star in stars], dtype=np.int32),
+            strings={
+                key: StringTable.from_values([star.get(key) or "" for star in stars])
+                for key in STRING_COLUMNS
+            },
+            header=header,
+        )
+
+    def star(self, i: int) -> Dict:
+        """Materialize one star as a plain dict (JSON-ready Python types)"""
+        magnitude = float(self.magnitude[i])
+        return {
+            "hr": int(self.hr[i]),
+            "name": self.strings["name"][i] or None,
+            "ra": float(self.ra[i]),
+            "dec": float(self.dec[i]),
+            "magnitude": None if np.isnan(magnitude) else magnitude,
+            "spectral_type": self.strings["spectral_type"][i] or None,
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the catalog (and its header sections) in the binary format"""
+        blocks: List[bytes] = []
+        columns: Dict[str, Dict] = {}
+        offset = 0
+
+        def add(name: str, array: np.ndarray) -> None:
+            nonlocal offset
+            data = array.tobytes()
+            columns[name] = {"dtype": array.dtype.str, "offset": offset, "count": len(array)}
+            blocks.append(data + b"\0" * _pad(len(data)))
+            offset += len(data) + _pad(len(data))
+
+        for name, dtype in NUMERIC_COLUMNS.items():
+            add(name, getattr(self, name).astype(dtype))
+        for name, table in self.strings.items():
+            add(f"{name}.offsets", table.offsets.astype("<u4"))
+            add(f"{name}.data", np.frombuffer(table.data, dtype=np.uint8))
+
+        header = json.dumps({**self.header, "columns": columns}).encode("utf-8")
+        header += b" " * _pad(len(MAGIC) + 4 + len(header))
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for block in blocks:
+                f.write(block)
+
+    @classmethod
+    def load(cls, path: Path) -> "StarCatalog":
+        """Memory-map a binary catalog written by StarCatalog.write"""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a star catalog file: {path}")
+
+        (header_len,) = struct.unpack_from("<I", buffer, len(MAGIC))
+        data_start = len(MAGIC) + 4 + header_len
+        header = json.loads(bytes(buffer[len(MAGIC) + 4:data_start]))
+        columns = header.pop("columns")
+
+        def column(name: str) -> np.ndarray:
+            spec = columns[name]
+            return np.frombuffer(
+                buffer, dtype=spec["dtype"], count=spec["count"], offset=data_start + spec["offset"]
+            )
+
+        return cls(
+            **{name: column(name) for name in NUMERIC_COLUMNS},
+            strings={
+                name: StringTable(column(f"{name}.offsets"), column(f"{name}.data"))
+                for name in STRING_COLUMNS
+            },
+            header=header,
+        )
+
+
+class StringTable:
+    """Concatenated UTF-8 strings addressed by an offsets array"""
+
+    def __init__(self, offsets: np.ndarray, data):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_values(cls, values: Sequence[str]) -> "StringTable":
+        encoded = [v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+        offsets[1:] = np.cumsum([len(e) for e in encoded])
+        return cls(offsets, b"".join(encoded))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return bytes(self.data[start:end]).decode("utf-8")
+
+
+def load_star_database(path: str) -> StarCatalog:
+    """
+    Load the star database from either stars.json or a compiled catalog
+
+    The JSON sections (metadata, gates, named_stars) end up in
+    StarCatalog.header in both cases.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, "r") as f:
+            stars_db = json.load(f)
+        bright_stars = stars_db.pop("bright_stars", [])
+        return StarCatalog.from_stars(bright_stars, header=stars_db)
+    return StarCatalog.load(path)
+
+
+def compile_catalog(json_path: str, bin_path: str) -> StarCatalog:
+    """Compile stars.json into the binary catalog format"""
+    catalog = load_star_database(json_path)
+    catalog.write(Path(bin_path))
+    return catalog
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "stars.json"
+    target = sys.argv[2] if len(sys.argv) > 2 else "stars.bin"
+
+    catalog = compile_catalog(source, target)
+    print(f"Compiled {len(catalog)} stars from {source} into {target}")
@@ -11,7 +11,7 @@ mkdir -p tower6_bridge vault/scrolls
 # Create requirements file
 cat > requirements.txt << 'EOF'
 mcp[cli]>=0.9.0
-httpx>=0.27.0
+httpx[http2]>=0.27.0
 pydantic>=2.0.0
 python-dotenv>=1.0.0
 EOF
@@ -29,13 +29,7 @@ if [ ! -f .env ]; then
     echo "✅ Created .env file"
 fi
 
-# Create vault index
-cat > vault/index.json << 'EOF'
-{
-  "scrolls": []
-}
-EOF
-
+# The vault index (vault/vault.db) is created on first run
 echo "✅ Created vault structure"
 
 # Install dependencies
@@ -0,0 +1,185 @@
+"""
+Atlas Response Cache - Tower 6 MCP Bridge
+
+Serves repeated Atlas tool calls locally. Gates, keys and patterns are
+static catalogs; atlas payloads are a pure function of the spiral
+position K, so one entry per K answers every date and coordinate that
+lands on it. Expired entries are revalidated with If-None-Match.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from tower6_bridge.atlas_client import AtlasClient
+from tower6_bridge.spiral import coordinate_to_position, position_for_date
+
+# Payload keys that vary per request rather than per spiral position
+_REQUEST_KEYS = ("date", "S", "L", "P")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response plus what is needed to revalidate it"""
+    value: Dict[str, Any]
+    etag: Optional[str]
+    expires_at: float
+    path: str
+    params: Optional[Dict[str, Any]]
+
+
+class LRUCache:
+    """Bounded least-recently-used map of CacheEntry objects"""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get an entry (fresh or expired) and mark it recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used beyond capacity"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class CachedAtlasClient:
+    """AtlasClient wrapper that answers repeat calls from a local cache"""
+
+    def __init__(
+        self,
+        client: AtlasClient,
+        static_ttl_s: float = 3600.0,
+        payload_ttl_s: float = 86400.0,
+        max_entries: int = 2048,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            client: Underlying Atlas API client
+            static_ttl_s: Freshness of gates/keys/patterns before revalidating
+            payload_ttl_s: Freshness of per-K atlas payloads before revalidating
+            max_entries: LRU capacity (1001 covers the whole spiral)
+            clock: Monotonic time source
+        """
+        self.client = client
+        self.static_ttl_s = static_ttl_s
+        self.payload_ttl_s = payload_ttl_s
+        self.cache = LRUCache(max_entries)
+        self.clock = clock
+
+        # Learned from the first atlas payload; needed to map dates to K
+        self.anchor_date: Optional[date] = None
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get(
+        self, key: Hashable, path: str, params: Optional[Dict[str, Any]], ttl_s: float,
+        extract: Callable[[Dict[str, Any]], Dict[str, Any]] = lambda payload: payload,
+    ) -> Dict[str, Any]:
+        """Serve key from cache, revalidating or fetching when stale"""
+        now = self.clock()
+        entry = self.cache.get(key)
+        if entry is not None and now < entry.expires_at:
+            return entry.value
+
+        # The ETag belongs to the URL it came from, so keep that URL with it
+        if entry is not None:
+            path, params = entry.path, entry.params
+            payload, etag = await self.client.fetch(path, params, etag=entry.etag)
+            if payload is None:
+                entry.expires_at = now + ttl_s
+                return entry.value
+        else:
+            payload, etag = await self.client.fetch(path, params)
+
+        entry = CacheEntry(extract(payload), etag, now + ttl_s, path, params)
+        self.cache.put(key, entry)
+        return entry.value
+
+    # ----- atlas payloads (keyed by spiral position) -----
+
+    def _position_for_date(self, date_str: str) -> Optional[Tuple[int, str]]:
+        """
+        Spiral position K and the normalized ISO date, as the API reports
+        them, once the anchor date is known
+        """
+        if self.anchor_date is None:
+            return None
+        try:
+            target = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+        return position_for_date(target, self.anchor_date), target.isoformat()
+
+    def _remember(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Learn the anchor date and strip the per-request keys off a payload"""
+        if self.anchor_date is None and payload.get("anchor_date"):
+            self.anchor_date = date.fromisoformat(payload["anchor_date"])
+        return {k: v for k, v in payload.items() if k not in _REQUEST_KEYS}
+
+    async def get_atlas_by_date(self, date: str) -> Dict[str, Any]:
+        """Get constellation data for a specific date (cached per K)"""
+        located = self._position_for_date(date)
+        if located is None:
+            payload, etag = await self.client.fetch("/atlas", {"date": date})
+            self.cache.put(
+                ("K", payload["K"]),
+                CacheEntry(
+                    self._remember(payload), etag, self.clock() + self.payload_ttl_s,
+                    "/atlas", {"date": date},
+                ),
+            )
+            return payload
+
+        K, iso_date = located
+        position = await self._get(
+            ("K", K), "/atlas", {"date": iso_date}, self.payload_ttl_s, self._remember
+        )
+        return {"date": iso_date, **position}
+
+    async def get_atlas_by_coordinate(self, S: int, L: int, P: int) -> Dict[str, Any]:
+        """Get constellation by Sky Address coordinates (cached per K)"""
+        K = coordinate_to_position(S, L, P)
+        position = await self._get(
+            ("K", K), "/atlas/coordinate", {"S": S, "L": L, "P": P},
+            self.payload_ttl_s, self._remember,
+        )
+        return {"date": None, **position, "S": S, "L": L, "P": P}
+
+    async def get_today(self) -> Dict[str, Any]:
+        """Get today's constellation (always asks the server for its today)"""
+        return await self.client.get_today()
+
+    # ----- static catalogs -----
+
+    async def get_gates(self) -> Dict[str, Any]:
+        """Get all 7 Spiral Gate definitions"""
+        return await self._get("gates", "/atlas/gates", None, self.static_ttl_s)
+
+    async def get_solar_keys(self) -> Dict[str, Any]:
+        """Get all 11 Solar Key Signatures"""
+        return await self._get("keys", "/atlas/keys", None, self.static_ttl_s)
+
+    async def get_lunar_patterns(self) -> Dict[str, Any]:
+        """Get all 13 Lunar Pattern Types"""
+        return await self._get("patterns", "/atlas/patterns", None, self.static_ttl_s)
@@ -5,24 +5,153 @@ Connects to the Celestial Atlas API (local or Railway).
 """
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import random
+
 import httpx
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# HTTP statuses worth retrying: rate limiting and gateway/overload errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """True for network failures and retryable HTTP statuses"""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return False
+
+
+async def fetch_concurrently(
+    fetch: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    concurrency: int = 8,
+    retries: int = 3,
+    backoff_s: float = 0.25,
+) -> List[R | BaseException]:
+    """
+    Run fetch over items with bounded parallelism and retries.
+
+    Args:
+        fetch: Coroutine function called once per item
+        items: Inputs, e.g. date strings
+        concurrency: Maximum fetches in flight at once
+        retries: Extra attempts after a transient failure
+        backoff_s: Base delay, doubled per attempt with jitter
+
+    Returns:
+        One result per item, in input order; an item that still fails
+        (or fails permanently) yields its exception instead
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R | BaseException:
+        for attempt in range(retries + 1):
+            try:
+                async with semaphore:
+                    return await fetch(item)
+            except Exception as e:
+                if attempt == retries or not is_transient_error(e):
+                    return e
+            await asyncio.sleep(backoff_s * (2 ** attempt) * (1 + random.random()))
+
+    return await asyncio.gather(*(run(item) for item in items))
 
 
 class AtlasClient:
     """HTTP client for Celestial Atlas API"""
 
-    def __init__(self, base_url: str, timeout_s: float = 20.0):
+    def __init__(
+        self,
+        base_url: str,
+        timeout_s: float = 20.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry_s: float = 30.0,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize the Atlas client.
+
+        Args:
+            base_url: Atlas API base URL
+            timeout_s: Per-request timeout in seconds
+            max_connections: Upper bound on open connections in the pool
+            max_keepalive_connections: Idle connections kept for reuse
+            keepalive_expiry_s: Seconds an idle connection stays open
+            http2: Force HTTP/2 on or off (default: on when h2 is installed)
+        """
         self.base_url = base_url.rstrip("/")
         self.timeout_s = timeout_s
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self.http2 = _http2_available() if http2 is None else http2
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared pooled client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout_s,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AtlasClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def _request(self, method: str, path: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request to Atlas API"""
-        url = self.base_url + path
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            r = await client.request(method, url, params=params)
-            r.raise_for_status()
-            return r.json()
+        """Make HTTP request to Atlas API over the pooled connection"""
+        r = await self._get_client().request(method, path, params=params)
+        r.raise_for_status()
+        return r.json()
+
+    async def fetch(
+        self, path: str, params: Dict[str, Any] = None, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Conditional GET against the Atlas API.
+
+        Args:
+            path: API path, e.g. "/atlas/gates"
+            params: Query parameters
+            etag: ETag of a cached copy, sent as If-None-Match
+
+        Returns:
+            Tuple of (payload, etag); payload is None when the server
+            answered 304 Not Modified
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        r = await self._get_client().get(path, params=params, headers=headers)
+        if r.status_code == 304:
+            return None, etag
+        r.raise_for_status()
+        return r.json(), r.headers.get("etag")
 
     async def get_atlas_by_date(self, date: str) -> Dict[str, Any]:
         """
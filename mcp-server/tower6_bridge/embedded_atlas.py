@@ -0,0 +1,86 @@
+"""
+Embedded Atlas - Tower 6 MCP Bridge
+
+Drives the backend's AtlasEngine in-process instead of calling the
+Celestial Atlas API over HTTP. Exposes the same coroutine methods as
+AtlasClient, so the MCP tools return identical payloads with no network
+hop and no backend running.
+"""
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# backend/ next to mcp-server/ in this repository
+DEFAULT_BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+
+class EmbeddedAtlasClient:
+    """AtlasClient-compatible facade over an in-process AtlasEngine"""
+
+    def __init__(
+        self,
+        backend_dir: Path = DEFAULT_BACKEND_DIR,
+        anchor_date: str = "2025-04-03",
+        stars_db_path: Optional[Path] = None,
+    ):
+        """
+        Load the Atlas engine from the backend source tree.
+
+        Args:
+            backend_dir: Directory containing atlas_engine.py
+            anchor_date: Spiral anchor date (YYYY-MM-DD), as ANCHOR_DATE in the backend
+            stars_db_path: Star catalog; defaults to the backend's stars.bin
+                when compiled, else stars.json
+        """
+        backend_dir = Path(backend_dir).resolve()
+        if not (backend_dir / "atlas_engine.py").exists():
+            raise FileNotFoundError(f"atlas_engine.py not found in {backend_dir}")
+
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+        from atlas_engine import AtlasEngine
+
+        if stars_db_path is None:
+            compiled = backend_dir / "stars.bin"
+            stars_db_path = compiled if compiled.exists() else backend_dir / "stars.json"
+
+        self.engine = AtlasEngine(
+            anchor_date=datetime.strptime(anchor_date, "%Y-%m-%d").date(),
+            stars_db_path=str(stars_db_path),
+        )
+
+    async def aclose(self) -> None:
+        """Nothing to release; present for parity with AtlasClient"""
+
+    async def get_atlas_by_date(self, date: str) -> Dict[str, Any]:
+        """Get constellation data for a specific date (YYYY-MM-DD)"""
+        try:
+            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        return self.engine.generate_atlas_payload(target_date)
+
+    async def get_atlas_by_coordinate(self, S: int, L: int, P: int) -> Dict[str, Any]:
+        """Get constellation by Sky Address coordinates"""
+        if not (1 <= S <= 11 and 1 <= L <= 13 and 1 <= P <= 7):
+            raise ValueError("Coordinates out of range: S 1-11, L 1-13, P 1-7")
+        return self.engine.generate_coordinate_payload(S, L, P)
+
+    async def get_today(self) -> Dict[str, Any]:
+        """Get today's constellation"""
+        return self.engine.generate_atlas_payload(date.today())
+
+    async def get_gates(self) -> Dict[str, Any]:
+        """Get all 7 Spiral Gate definitions"""
+        return self.engine.gates_document()
+
+    async def get_solar_keys(self) -> Dict[str, Any]:
+        """Get all 11 Solar Key Signatures"""
+        return self.engine.solar_keys_document()
+
+    async def get_lunar_patterns(self) -> Dict[str, Any]:
+        """Get all 13 Lunar Pattern Types"""
+        return self.engine.lunar_patterns_document()
@@ -9,29 +9,92 @@ Stored. Retrievable. Kind.
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
+from datetime import date as Date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, List, Optional
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
-from tower6_bridge.atlas_client import AtlasClient
+from tower6_bridge.atlas_cache import CachedAtlasClient
+from tower6_bridge.atlas_client import AtlasClient, fetch_concurrently
+from tower6_bridge.embedded_atlas import DEFAULT_BACKEND_DIR, EmbeddedAtlasClient
 from tower6_bridge.vault_store import VaultStore
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
+ATLAS_MODE = os.getenv("ATLAS_MODE", "http").lower()  # "http" or "embedded"
+ATLAS_BACKEND_DIR = Path(os.getenv("ATLAS_BACKEND_DIR", str(DEFAULT_BACKEND_DIR)))
+ATLAS_ANCHOR_DATE = os.getenv("ATLAS_ANCHOR_DATE", "2025-04-03")
+ATLAS_STARS_DB = os.getenv("ATLAS_STARS_DB")
 ATLAS_BASE_URL = os.getenv("ATLAS_BASE_URL", "http://localhost:8000")
 VAULT_DIR = Path(os.getenv("VAULT_DIR", "./vault"))
 VAULT_MAX_SCROLL_KB = int(os.getenv("VAULT_MAX_SCROLL_KB", "256"))
+VAULT_BLOBS = os.getenv("VAULT_BLOBS", "0") not in ("0", "false", "no", "off")
+VAULT_COMPRESS_MIN_BYTES = int(os.getenv("VAULT_COMPRESS_MIN_BYTES", "4096"))
+VAULT_BODY_CACHE_MB = float(os.getenv("VAULT_BODY_CACHE_MB", "16"))
+ATLAS_MAX_CONNECTIONS = int(os.getenv("ATLAS_MAX_CONNECTIONS", "10"))
+ATLAS_MAX_KEEPALIVE = int(os.getenv("ATLAS_MAX_KEEPALIVE", "5"))
+ATLAS_KEEPALIVE_EXPIRY_S = float(os.getenv("ATLAS_KEEPALIVE_EXPIRY_S", "30"))
+ATLAS_CACHE = os.getenv("ATLAS_CACHE", "1") not in ("0", "false", "no", "off")
+ATLAS_CACHE_STATIC_TTL_S = float(os.getenv("ATLAS_CACHE_STATIC_TTL_S", "3600"))
+ATLAS_CACHE_PAYLOAD_TTL_S = float(os.getenv("ATLAS_CACHE_PAYLOAD_TTL_S", "86400"))
+ATLAS_CACHE_MAX_ENTRIES = int(os.getenv("ATLAS_CACHE_MAX_ENTRIES", "2048"))
+ATLAS_FANOUT_CONCURRENCY = int(os.getenv("ATLAS_FANOUT_CONCURRENCY", "8"))
+ATLAS_FANOUT_RETRIES = int(os.getenv("ATLAS_FANOUT_RETRIES", "3"))
+
+# Most days a single get_atlas_readings call may cover
+MAX_READING_DAYS = 366
+VAULT_PAGE_SIZE = int(os.getenv("VAULT_PAGE_SIZE", "20"))
+MAX_READ_SCROLLS = 100
 
 # Initialize clients
-atlas = AtlasClient(base_url=ATLAS_BASE_URL)
-vault = VaultStore(root=VAULT_DIR, max_scroll_kb=VAULT_MAX_SCROLL_KB)
+if ATLAS_MODE == "embedded":
+    # Drive AtlasEngine in-process: no backend or network needed
+    atlas = EmbeddedAtlasClient(
+        backend_dir=ATLAS_BACKEND_DIR,
+        anchor_date=ATLAS_ANCHOR_DATE,
+        stars_db_path=Path(ATLAS_STARS_DB) if ATLAS_STARS_DB else None,
+    )
+else:
+    atlas = AtlasClient(
+        base_url=ATLAS_BASE_URL,
+        max_connections=ATLAS_MAX_CONNECTIONS,
+        max_keepalive_connections=ATLAS_MAX_KEEPALIVE,
+        keepalive_expiry_s=ATLAS_KEEPALIVE_EXPIRY_S,
+    )
+    if ATLAS_CACHE:
+        atlas = CachedAtlasClient(
+            atlas,
+            static_ttl_s=ATLAS_CACHE_STATIC_TTL_S,
+            payload_ttl_s=ATLAS_CACHE_PAYLOAD_TTL_S,
+            max_entries=ATLAS_CACHE_MAX_ENTRIES,
+        )
+
+vault = VaultStore(
+    root=VAULT_DIR,
+    max_scroll_kb=VAULT_MAX_SCROLL_KB,
+    blob_store=VAULT_BLOBS,
+    compress_min_bytes=VAULT_COMPRESS_MIN_BYTES,
+    body_cache_bytes=int(VAULT_BODY_CACHE_MB * 1024 * 1024),
+    anchor_date=Date.fromisoformat(ATLAS_ANCHOR_DATE),
+)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled Atlas connections when the server shuts down"""
+    try:
+        yield
+    finally:
+        await atlas.aclose()
+
 
 # Create FastMCP server
-mcp = FastMCP(name="Tower 6 Celestial Atlas Bridge")
+mcp = FastMCP(name="Tower 6 Celestial Atlas Bridge", lifespan=lifespan)
 
 
 # ===== ATLAS TOOLS =====
@@ -79,6 +142,66 @@ async def get_atlas_by_coordinate(S: int, L: int, P: int) -> Dict[str, Any]:
     return await atlas.get_atlas_by_coordinate(S, L, P)
 
 
+def _reading_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact per-day view of an Atlas payload"""
+    return {
+        "date": payload["date"],
+        "K": payload["K"],
+        "sky_address": payload["sky_address"],
+        "gate": payload["gate"]["name"],
+        "pattern": payload["pattern"]["name"],
+        "key_signature": payload["key_signature"]["name"],
+        "message": payload["message"],
+        "one_noble_thread": payload["one_noble_thread"],
+        "star_count": len(payload["stars_highlighted"]),
+        "line_count": len(payload["lines"]),
+    }
+
+
+@mcp.tool()
+async def get_atlas_readings(
+    dates: List[str] | None = None, start: str | None = None, end: str | None = None
+) -> List[Dict[str, Any]]:
+    """
+    Get compact readings for many dates in one call.
+
+    Pass either an explicit list of dates or an inclusive start/end range
+    (up to 366 days). Days are fetched concurrently with retries, so a
+    week or month costs about as much time as a single day.
+
+    Args:
+        dates: List of date strings in YYYY-MM-DD format
+        start: First date of a range (YYYY-MM-DD)
+        end: Last date of a range, inclusive (YYYY-MM-DD)
+
+    Returns:
+        One summary per day, in order, with date, K, sky_address, gate,
+        pattern, key_signature, message, one_noble_thread, star_count and
+        line_count; days that could not be fetched carry an "error" instead
+    """
+    if dates is None:
+        if not (start and end):
+            raise ValueError("Provide either dates or both start and end")
+        first, last = Date.fromisoformat(start), Date.fromisoformat(end)
+        if last < first:
+            raise ValueError("end must not be before start")
+        dates = [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+    if len(dates) > MAX_READING_DAYS:
+        raise ValueError(f"Too many dates: max {MAX_READING_DAYS}")
+
+    results = await fetch_concurrently(
+        atlas.get_atlas_by_date,
+        dates,
+        concurrency=ATLAS_FANOUT_CONCURRENCY,
+        retries=ATLAS_FANOUT_RETRIES,
+    )
+    return [
+        {"date": d, "error": str(r)} if isinstance(r, BaseException) else _reading_summary(r)
+        for d, r in zip(dates, results)
+    ]
+
+
 @mcp.tool()
 async def get_today_constellation() -> Dict[str, Any]:
     """
@@ -158,6 +281,7 @@ def vault_write_scroll(
         - path: File path
         - ts: Unix timestamp
         - size_kb: Size in kilobytes
+        - S, L, P, K: Sky Address of the day the scroll was written
     """
     return vault.write_scroll(title, body_md, tags)
 
@@ -180,32 +304,172 @@ def vault_read_scroll(scroll_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def vault_search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+def vault_read_scrolls(scroll_ids: List[str]) -> Dict[str, Any]:
+    """
+    Read several scrolls from the Vault in one call.
+
+    Use this instead of repeated vault_read_scroll calls, e.g. to review a
+    week of readings found with vault_list_all or vault_search.
+
+    Args:
+        scroll_ids: Up to 100 scroll identifiers
+
+    Returns:
+        Dictionary with:
+        - scrolls: One entry per found scroll (id, body_md, metadata), in the order requested
+        - missing: Requested ids that don't exist
+    """
+    if len(scroll_ids) > MAX_READ_SCROLLS:
+        raise ValueError(f"Too many scroll ids: max {MAX_READ_SCROLLS}")
+    return vault.read_scrolls(scroll_ids)
+
+
+def _parse_vault_time(value: Optional[str], end_of_day: bool = False) -> Optional[float]:
+    """
+    Unix time for a since/until filter given as YYYY-MM-DD or an ISO
+    datetime (UTC unless it carries an offset). A bare date used as an
+    upper bound covers that whole day.
+    """
+    if not value:
+        return None
+    try:
+        if len(value) == 10:
+            day = Date.fromisoformat(value) + timedelta(days=1 if end_of_day else 0)
+            moment = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        else:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}. Use YYYY-MM-DD or an ISO datetime")
+    return moment.timestamp()
+
+
+def _vault_filters(
+    tag: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    min_size_kb: Optional[float],
+    max_size_kb: Optional[float],
+) -> Dict[str, Any]:
+    return {
+        "tag": tag,
+        "since": _parse_vault_time(since),
+        "until": _parse_vault_time(until, end_of_day=True),
+        "min_size_kb": min_size_kb,
+        "max_size_kb": max_size_kb,
+    }
+
+
+@mcp.tool()
+def vault_search(
+    query: str,
+    limit: int = 10,
+    cursor: str | None = None,
+    tag: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    min_size_kb: float | None = None,
+    max_size_kb: float | None = None,
+) -> Dict[str, Any]:
     """
-    Search scrolls by title or tags.
+    Full-text search over scroll titles, tags and bodies, one page at a time.
+
+    Every word must match (as a prefix, so "reson" finds "resonance");
+    title matches rank above tag matches, which rank above body matches.
 
     Args:
         query: Search query string (case-insensitive)
-        limit: Maximum number of results to return (default: 10)
+        limit: Page size (default: 10)
+        cursor: next_cursor from the previous page, to continue
+        tag: Only scrolls with this tag
+        since: Only scrolls written on/after this date (YYYY-MM-DD or ISO datetime)
+        until: Only scrolls written up to this date (inclusive for YYYY-MM-DD)
+        min_size_kb: Only scrolls at least this large
+        max_size_kb: Only scrolls at most this large
 
     Returns:
-        List of matching scroll metadata entries, most recent first
+        Dictionary with:
+        - items: Matching scroll metadata entries, best match first, each
+          with a relevance "score" and a "snippet" of the body around the hit
+        - next_cursor: Cursor for the next page, or null on the last page
     """
-    return vault.search(query, limit)
+    filters = _vault_filters(tag, since, until, min_size_kb, max_size_kb)
+    return vault.search_page(query, max(1, limit), cursor, **filters)
 
 
 @mcp.tool()
-def vault_list_all(limit: int | None = None) -> List[Dict[str, Any]]:
+def vault_list_all(
+    limit: int = VAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    tag: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    min_size_kb: float | None = None,
+    max_size_kb: float | None = None,
+) -> Dict[str, Any]:
     """
-    List all scrolls in the Vault.
+    List scrolls in the Vault, newest first, one page at a time.
 
     Args:
-        limit: Optional maximum number of scrolls to return
+        limit: Page size (default: 20)
+        cursor: next_cursor from the previous page, to continue
+        tag: Only scrolls with this tag
+        since: Only scrolls written on/after this date (YYYY-MM-DD or ISO datetime)
+        until: Only scrolls written up to this date (inclusive for YYYY-MM-DD)
+        min_size_kb: Only scrolls at least this large
+        max_size_kb: Only scrolls at most this large
 
     Returns:
-        List of scroll metadata entries in reverse chronological order
+        Dictionary with:
+        - items: Scroll metadata entries in reverse chronological order
+        - next_cursor: Cursor for the next page, or null on the last page
     """
-    return vault.list_all(limit)
+    filters = _vault_filters(tag, since, until, min_size_kb, max_size_kb)
+    return vault.list_page(max(1, limit), cursor, **filters)
+
+
+@mcp.tool()
+def vault_find_by_position(
+    gate: int | None = None,
+    lunar_pattern: int | None = None,
+    solar_key: int | None = None,
+    K: int | None = None,
+    date: str | None = None,
+    limit: int = VAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Find scrolls written at a spiral position, newest first.
+
+    Every scroll records the Sky Address (S, L, P, K) of the day it was
+    written, so past readings for the same gate or the same spiral day
+    can be pulled up directly. Combine filters to narrow the match.
+
+    Args:
+        gate: Gate / prime day P (1-7), e.g. 7 for The Golden Harp
+        lunar_pattern: Lunar month L (1-13)
+        solar_key: Solar month S (1-11)
+        K: Exact spiral position (0-1000)
+        date: Same spiral position as this date (YYYY-MM-DD)
+        limit: Page size (default: 20)
+        cursor: next_cursor from the previous page, to continue
+
+    Returns:
+        Dictionary with:
+        - items: Scroll metadata entries, each with its S, L, P and K
+        - next_cursor: Cursor for the next page, or null on the last page
+    """
+    on_date = None
+    if date:
+        try:
+            on_date = Date.fromisoformat(date)
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+    return vault.find_by_position(
+        K=K, S=solar_key, L=lunar_pattern, P=gate,
+        on_date=on_date, limit=max(1, limit), cursor=cursor,
+    )
 
 
 @mcp.tool()
@@ -224,17 +488,26 @@ def vault_delete_scroll(scroll_id: str) -> str:
 
 
 @mcp.tool()
-def vault_stats() -> Dict[str, Any]:
+def vault_stats(facets: bool = True, top_tags: int = 20, days: int = 30) -> Dict[str, Any]:
     """
-    Get Vault statistics.
+    Get Vault statistics, with optional facet breakdowns.
+
+    Args:
+        facets: Include tag, day and month breakdowns (default: true)
+        top_tags: Number of most-used tags to include (default: 20)
+        days: Number of most recent days with scrolls to include (default: 30)
 
     Returns:
         Dictionary with:
         - scroll_count: Total number of scrolls
         - total_size_kb: Total size of all scrolls in KB
         - vault_path: Path to vault directory
+        - blob_count / blob_stored_kb: Deduplicated blob storage on disk
+        - facets: tag_count, tags {tag: count}, days and months
+          {key: {scroll_count, size_kb}}, most recent first, and gates
+          {P: {name, scroll_count}}
     """
-    return vault.get_stats()
+    return vault.get_stats(facets=facets, top_tags=max(0, top_tags), days=max(0, days))
 
 
 # ===== RESOURCES =====
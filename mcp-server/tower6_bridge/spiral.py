@@ -0,0 +1,61 @@
+"""
+Spiral Math - Tower 6 MCP Bridge
+
+Sky Address arithmetic shared by the bridge, mirroring
+AtlasEngine.compute_sky_address in backend/atlas_engine.py so that the
+bridge can place dates on the 1001-day spiral without calling the API.
+
+Stored. Retrievable. Kind.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Tuple
+
+
+SPIRAL_DAYS = 1001
+DEFAULT_ANCHOR_DATE = date(2025, 4, 3)
+
+# Names only; the full definitions are served by the Atlas API
+GATE_NAMES = {
+    1: "The Breath of Collapse",
+    2: "The Bridge of Becoming",
+    3: "The Veil of Names",
+    4: "The Golden Rose",
+    5: "The World Tree",
+    6: "The Crystal Crown",
+    7: "The Golden Harp",
+}
+
+
+def position_for_date(target_date: date, anchor_date: date = DEFAULT_ANCHOR_DATE) -> int:
+    """Spiral position K (0-1000) of a date"""
+    # Python's % is already non-negative for a positive modulus
+    return (target_date - anchor_date).days % SPIRAL_DAYS
+
+
+def position_to_coordinate(K: int) -> Tuple[int, int, int]:
+    """Split a spiral position K (0-1000) into its (S, L, P) coordinate"""
+    S = (K // 91) + 1
+    R = K % 91
+    L = (R // 7) + 1
+    P = (R % 7) + 1
+    return S, L, P
+
+
+def coordinate_to_position(S: int, L: int, P: int) -> int:
+    """Inverse of position_to_coordinate: spiral position K for (S, L, P)"""
+    return ((S - 1) * 91) + ((L - 1) * 7) + (P - 1)
+
+
+def sky_address(target_date: date, anchor_date: date = DEFAULT_ANCHOR_DATE) -> Tuple[int, int, int, int]:
+    """
+    Convert a date to its Sky Address.
+
+    Returns:
+        Tuple of (S, L, P, K): solar month 1-11, lunar month 1-13,
+        prime day / gate 1-7, spiral position 0-1000
+    """
+    K = position_for_date(target_date, anchor_date)
+    S, L, P = position_to_coordinate(K)
+    return S, L, P, K
@@ -6,40 +6,1031 @@ Stored. Retrievable. Kind.
 """
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import io
 import json
+import os
+import re
+import sqlite3
+import tarfile
+import tempfile
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
+
+from tower6_bridge.spiral import DEFAULT_ANCHOR_DATE, GATE_NAMES, SPIRAL_DAYS, sky_address
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Ranking weights for title, tags and body in full-text search
+FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+# Words in a search query; each becomes a prefix term
+_QUERY_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+# Bulk archive format (see VaultStore.export_archive)
+ARCHIVE_FORMAT = "tower6-vault"
+ARCHIVE_VERSION = 1
+ARCHIVE_MANIFEST = "manifest.json"
+# Bodies held in memory at once while an import streams to disk
+IMPORT_BATCH = 256
+
+# Crockford base32, as used by ULID
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_DECODE = {c: i for i, c in enumerate(_ULID_ALPHABET)}
+_ULID_PATTERN = re.compile(r"^[0-9A-HJKMNP-TV-Z]{26}$")
+
+# Ids written before ULIDs: "<unix seconds>-<5 digits>"
+_LEGACY_ID_PATTERN = re.compile(r"^(\d{1,12})-\d{5}$")
+
+
+def _ulid_encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(_ULID_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+class ScrollIdGenerator:
+    """
+    ULID-style scroll ids: 48-bit millisecond timestamp plus 80 random
+    bits, 26 Crockford base32 characters. Ids sort by creation time and
+    are strictly increasing within a process, even within one millisecond
+    or if the clock steps back.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self) -> str:
+        with self._lock:
+            ms = int(self.clock() * 1000)
+            if ms <= self._last_ms:
+                ms, random_bits = self._last_ms, self._last_random + 1
+                if random_bits >= 1 << 80:
+                    ms, random_bits = ms + 1, int.from_bytes(os.urandom(10), "big")
+            else:
+                random_bits = int.from_bytes(os.urandom(10), "big")
+            self._last_ms, self._last_random = ms, random_bits
+        return _ulid_encode(ms, 10) + _ulid_encode(random_bits, 16)
+
+
+def scroll_id_timestamp(scroll_id: str) -> float:
+    """
+    Creation time (unix seconds) encoded in a scroll id.
+
+    Raises:
+        ValueError: If scroll_id is neither a ULID nor a legacy id
+    """
+    if _ULID_PATTERN.match(scroll_id):
+        ms = 0
+        for char in scroll_id[:10]:
+            ms = ms * 32 + _ULID_DECODE[char]
+        return ms / 1000
+    legacy = _LEGACY_ID_PATTERN.match(scroll_id)
+    if legacy:
+        return float(legacy.group(1))
+    raise ValueError(f"Invalid scroll id: {scroll_id}")
+
+
+def scroll_shard(scroll_id: str) -> str:
+    """Relative shard directory ("YYYY/MM", UTC) for a scroll id"""
+    created = datetime.fromtimestamp(scroll_id_timestamp(scroll_id), tz=timezone.utc)
+    return f"{created.year:04d}/{created.month:02d}"
+
+
+def _migrate_full_text(store: "VaultStore") -> None:
+    """Create the FTS5 index and fill it from the existing scrolls"""
+    store._db.execute(
+        "CREATE VIRTUAL TABLE scroll_fts USING fts5("
+        "title, tags, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    rows = store._db.execute("SELECT rowid, * FROM scrolls").fetchall()
+    for row in rows:
+        store._index_text(row["rowid"], row["title"], json.loads(row["tags"]), store._read_body_file(row["id"]))
+
+
+# Aggregate tables kept current by triggers, so every write path (single
+# writes, imports, other processes) updates them in the same transaction
+_AGGREGATE_SCHEMA = [
+    """
+    CREATE TABLE stats_totals (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        scroll_count INTEGER NOT NULL DEFAULT 0,
+        total_size_kb REAL NOT NULL DEFAULT 0,
+        blob_count INTEGER NOT NULL DEFAULT 0,
+        blob_stored_bytes INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE TABLE stats_tags (tag TEXT PRIMARY KEY, scroll_count INTEGER NOT NULL)",
+    """
+    CREATE TABLE stats_days (
+        day TEXT PRIMARY KEY,
+        scroll_count INTEGER NOT NULL,
+        size_kb REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER stats_scroll_insert AFTER INSERT ON scrolls BEGIN
+        UPDATE stats_totals SET scroll_count = scroll_count + 1,
+            total_size_kb = total_size_kb + NEW.size_kb;
+        INSERT INTO stats_days (day, scroll_count, size_kb)
+            VALUES (date(NEW.ts, 'unixepoch'), 1, NEW.size_kb)
+            ON CONFLICT (day) DO UPDATE SET scroll_count = scroll_count + 1,
+                size_kb = size_kb + excluded.size_kb;
+    END
+    """,
+    """
+    CREATE TRIGGER stats_scroll_delete AFTER DELETE ON scrolls BEGIN
+        UPDATE stats_totals SET scroll_count = scroll_count - 1,
+            total_size_kb = total_size_kb - OLD.size_kb;
+        UPDATE stats_days SET scroll_count = scroll_count - 1, size_kb = size_kb - OLD.size_kb
+            WHERE day = date(OLD.ts, 'unixepoch');
+        DELETE FROM stats_days WHERE day = date(OLD.ts, 'unixepoch') AND scroll_count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER stats_tag_insert AFTER INSERT ON scroll_tags BEGIN
+        INSERT INTO stats_tags (tag, scroll_count) VALUES (NEW.tag, 1)
+            ON CONFLICT (tag) DO UPDATE SET scroll_count = scroll_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER stats_tag_delete AFTER DELETE ON scroll_tags BEGIN
+        UPDATE stats_tags SET scroll_count = scroll_count - 1 WHERE tag = OLD.tag;
+        DELETE FROM stats_tags WHERE tag = OLD.tag AND scroll_count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER stats_blob_insert AFTER INSERT ON blobs BEGIN
+        UPDATE stats_totals SET blob_count = blob_count + 1,
+            blob_stored_bytes = blob_stored_bytes + NEW.stored_bytes;
+    END
+    """,
+    """
+    CREATE TRIGGER stats_blob_delete AFTER DELETE ON blobs BEGIN
+        UPDATE stats_totals SET blob_count = blob_count - 1,
+            blob_stored_bytes = blob_stored_bytes - OLD.stored_bytes;
+    END
+    """,
+]
+
+
+def _migrate_aggregates(store: "VaultStore") -> None:
+    """Create the aggregate tables and triggers, then fill them once"""
+    for statement in _AGGREGATE_SCHEMA:
+        store._db.execute(statement)
+    store._db.execute(
+        "INSERT INTO stats_totals (id, scroll_count, total_size_kb, blob_count, blob_stored_bytes)"
+        " SELECT 1, (SELECT COUNT(*) FROM scrolls), (SELECT COALESCE(SUM(size_kb), 0) FROM scrolls),"
+        " (SELECT COUNT(*) FROM blobs), (SELECT COALESCE(SUM(stored_bytes), 0) FROM blobs)"
+    )
+    store._db.execute(
+        "INSERT INTO stats_tags (tag, scroll_count)"
+        " SELECT tag, COUNT(*) FROM scroll_tags GROUP BY tag"
+    )
+    store._db.execute(
+        "INSERT INTO stats_days (day, scroll_count, size_kb)"
+        " SELECT date(ts, 'unixepoch'), COUNT(*), SUM(size_kb) FROM scrolls GROUP BY 1"
+    )
+
+
+def _migrate_spiral_positions(store: "VaultStore") -> None:
+    """
+    Add indexed Sky Address columns and the per-gate aggregate. Values are
+    filled by VaultStore._sync_spiral_positions, which also redoes them
+    when the anchor date changes.
+    """
+    for column in ("S", "L", "P", "K"):
+        store._db.execute(f"ALTER TABLE scrolls ADD COLUMN {column} INTEGER")
+        store._db.execute(f"CREATE INDEX idx_scrolls_{column} ON scrolls ({column}, ts, id)")
+    store._db.execute("CREATE TABLE vault_meta (key TEXT PRIMARY KEY, value TEXT)")
+    store._db.execute("CREATE TABLE stats_gates (gate INTEGER PRIMARY KEY, scroll_count INTEGER NOT NULL)")
+    store._db.execute("""
+        CREATE TRIGGER stats_gate_insert AFTER INSERT ON scrolls WHEN NEW.P IS NOT NULL BEGIN
+            INSERT INTO stats_gates (gate, scroll_count) VALUES (NEW.P, 1)
+                ON CONFLICT (gate) DO UPDATE SET scroll_count = scroll_count + 1;
+        END
+    """)
+    store._db.execute("""
+        CREATE TRIGGER stats_gate_delete AFTER DELETE ON scrolls WHEN OLD.P IS NOT NULL BEGIN
+            UPDATE stats_gates SET scroll_count = scroll_count - 1 WHERE gate = OLD.P;
+            DELETE FROM stats_gates WHERE gate = OLD.P AND scroll_count <= 0;
+        END
+    """)
+    store._db.execute("""
+        CREATE TRIGGER stats_gate_update AFTER UPDATE OF P ON scrolls BEGIN
+            UPDATE stats_gates SET scroll_count = scroll_count - 1 WHERE gate = OLD.P;
+            DELETE FROM stats_gates WHERE gate = OLD.P AND scroll_count <= 0;
+            INSERT INTO stats_gates (gate, scroll_count) SELECT NEW.P, 1 WHERE NEW.P IS NOT NULL
+                ON CONFLICT (gate) DO UPDATE SET scroll_count = scroll_count + 1;
+        END
+    """)
+
+
+# Schema migrations, applied in order; PRAGMA user_version records how
+# many have run against a given vault.db. Entries are SQL scripts or
+# callables run inside the migration transaction.
+SCHEMA_MIGRATIONS: List[Union[str, Callable[["VaultStore"], None]]] = [
+    """
+    CREATE TABLE scrolls (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        tags TEXT NOT NULL DEFAULT '[]',
+        path TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        size_kb REAL NOT NULL DEFAULT 0
+    );
+    CREATE INDEX idx_scrolls_ts ON scrolls (ts);
+    CREATE TABLE scroll_tags (
+        tag TEXT NOT NULL,
+        scroll_id TEXT NOT NULL REFERENCES scrolls (id) ON DELETE CASCADE,
+        PRIMARY KEY (tag, scroll_id)
+    );
+    CREATE INDEX idx_scroll_tags_scroll ON scroll_tags (scroll_id);
+    """,
+    _migrate_full_text,
+    """
+    CREATE TABLE journal (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        op TEXT NOT NULL,
+        scroll_id TEXT NOT NULL,
+        entry TEXT,
+        ts INTEGER NOT NULL
+    );
+    """,
+    """
+    DROP INDEX idx_scrolls_ts;
+    CREATE INDEX idx_scrolls_ts_id ON scrolls (ts, id);
+    """,
+    """
+    ALTER TABLE scrolls ADD COLUMN blob TEXT;
+    CREATE INDEX idx_scrolls_blob ON scrolls (blob);
+    CREATE TABLE blobs (
+        hash TEXT PRIMARY KEY,
+        refcount INTEGER NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        stored_bytes INTEGER NOT NULL
+    );
+    """,
+    _migrate_aggregates,
+    _migrate_spiral_positions,
+]
+
+
+def scroll_sky_address(ts: float, anchor_date: date = DEFAULT_ANCHOR_DATE) -> Dict[str, int]:
+    """S, L, P and K of the UTC day a scroll was written"""
+    S, L, P, K = sky_address(datetime.fromtimestamp(ts, tz=timezone.utc).date(), anchor_date)
+    return {"S": S, "L": L, "P": P, "K": K}
+
+# Compressed blob files carry this suffix
+_ZLIB_SUFFIX = ".z"
+
+
+def encode_cursor(kind: str, *key: Any) -> str:
+    """Opaque page cursor: base64url of the keyset position"""
+    raw = json.dumps([kind, *key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(kind: str, cursor: str) -> List[Any]:
+    """
+    Keyset position from a cursor made by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or from another kind of listing
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(value, list) or not value or value[0] != kind:
+        raise ValueError("Invalid cursor")
+    return value[1:]
+
+
+def _filter_clauses(
+    tag: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    min_size_kb: Optional[float] = None,
+    max_size_kb: Optional[float] = None,
+    S: Optional[int] = None,
+    L: Optional[int] = None,
+    P: Optional[int] = None,
+    K: Optional[int] = None,
+) -> Tuple[List[str], List[Any]]:
+    """SQL conditions (on scrolls aliased as s) and parameters for page filters"""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if tag is not None:
+        clauses.append("EXISTS (SELECT 1 FROM scroll_tags t WHERE t.scroll_id = s.id AND t.tag = ?)")
+        params.append(tag)
+    if since is not None:
+        clauses.append("s.ts >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("s.ts < ?")
+        params.append(until)
+    if min_size_kb is not None:
+        clauses.append("s.size_kb >= ?")
+        params.append(min_size_kb)
+    if max_size_kb is not None:
+        clauses.append("s.size_kb <= ?")
+        params.append(max_size_kb)
+    for column, value in (("S", S), ("L", L), ("P", P), ("K", K)):
+        if value is not None:
+            clauses.append(f"s.{column} = ?")
+            params.append(value)
+    return clauses, params
+
+
+class VaultLock:
+    """
+    Advisory lock on <vault>/vault.lock, shared by every process using the
+    vault. Re-entrant within a process; pair with a threading lock.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        if self._depth == 0:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    while True:
+                        try:
+                            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            continue  # LK_LOCK gives up after ~10s; keep waiting
+            except BaseException:
+                os.close(fd)
+                raise
+            self._fd = fd
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename in path (no-op where directories can't be opened)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Replace path with text so readers see the old or the new file, never
+    a truncated one: write a temp file, fsync it, rename it over path.
+    """
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Binary counterpart of atomic_write_text"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+@dataclass
+class IndexSnapshot:
+    """
+    Parsed scroll index held in memory.
+
+    signature and data_version describe the database state the snapshot
+    was loaded from; VaultStore reloads it when either moves.
+    """
+    signature: Tuple
+    data_version: int
+    entries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    order: List[str] = field(default_factory=list)  # ids by (ts, id), most recent first
+
+    def add(self, entry: Dict[str, Any]) -> bool:
+        """
+        Apply a newly written entry.
+
+        Returns:
+            False when the entry does not sort first (e.g. back-dated
+            imports) and the snapshot should be reloaded instead
+        """
+        if self.order:
+            newest = self.entries[self.order[0]]
+            if (entry["ts"], entry["id"]) < (newest["ts"], newest["id"]):
+                return False
+        if entry["id"] in self.entries:
+            self.remove(entry["id"])
+        self.entries[entry["id"]] = entry
+        self.order.insert(0, entry["id"])
+        return True
+
+    def remove(self, scroll_id: str) -> None:
+        """Drop an entry"""
+        if self.entries.pop(scroll_id, None) is not None:
+            self.order.remove(scroll_id)
+
+
+class BodyCache:
+    """Least-recently-used scroll bodies, bounded by total UTF-8 bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._bodies: OrderedDict[str, Tuple[str, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def get(self, scroll_id: str) -> Optional[str]:
+        item = self._bodies.get(scroll_id)
+        if item is None:
+            return None
+        self._bodies.move_to_end(scroll_id)
+        return item[0]
+
+    def put(self, scroll_id: str, body_md: str) -> None:
+        """Cache a body; bodies larger than the whole budget are skipped"""
+        size = len(body_md.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self.discard(scroll_id)
+        self._bodies[scroll_id] = (body_md, size)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, (_, evicted) = self._bodies.popitem(last=False)
+            self.size_bytes -= evicted
+
+    def discard(self, scroll_id: str) -> None:
+        item = self._bodies.pop(scroll_id, None)
+        if item is not None:
+            self.size_bytes -= item[1]
+
+    def clear(self) -> None:
+        self._bodies.clear()
+        self.size_bytes = 0
+
+
+def _copy_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached entry so callers cannot mutate the snapshot"""
+    return {**entry, "tags": list(entry["tags"])}
 
 
 class VaultStore:
     """Storage system for Tower 6 sacred scrolls"""
 
-    def __init__(self, root: Path, max_scroll_kb: int = 256):
+    def __init__(
+        self,
+        root: Path,
+        max_scroll_kb: int = 256,
+        blob_store: bool = False,
+        compress_min_bytes: int = 4096,
+        body_cache_bytes: int = 16 * 1024 * 1024,
+        anchor_date: date = DEFAULT_ANCHOR_DATE,
+    ):
         """
         Initialize Vault storage.
 
         Args:
             root: Root directory for vault storage
             max_scroll_kb: Maximum scroll size in KB
+            blob_store: Store new bodies content-addressed under blobs/
+                (deduplicated, reference counted) instead of one file each
+            compress_min_bytes: Blob bodies at least this large are zlib-compressed
+            body_cache_bytes: Memory budget for recently read scroll bodies (0 disables)
+            anchor_date: Spiral anchor date, as ANCHOR_DATE in the backend;
+                scrolls get the S, L, P and K of the day they were written
         """
         self.root = Path(root)
         self.max_scroll_kb = max_scroll_kb
+        self.blob_store = blob_store
+        self.anchor_date = anchor_date
+        self.compress_min_bytes = compress_min_bytes
         self.scroll_dir = self.root / "scrolls"
+        self.blob_dir = self.root / "blobs"
         self.scroll_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "vault.db"
         self.index_path = self.root / "index.json"
+        self.ids = ScrollIdGenerator()
+
+        # One connection per store, shared across MCP worker threads;
+        # vault.lock serializes writers across processes
+        self._lock = threading.RLock()
+        self._file_lock = VaultLock(self.root / "vault.lock")
+        self._connect()
+
+        # In-memory index, loaded on first read, and hot scroll bodies;
+        # both are dropped whenever the vault changes underneath us
+        self._snapshot: Optional[IndexSnapshot] = None
+        self._bodies = BodyCache(body_cache_bytes)
+
+        # Blobs whose last reference went away; unlinked once the
+        # transaction that dropped them commits
+        self._freed_blobs: List[str] = []
+
+        with self._writer():
+            self._migrate_schema()
+            self._replay_journal()
+            self._sync_spiral_positions()
+
+            # One-shot import of a legacy index.json vault
+            if self.index_path.exists():
+                self._import_index_json()
+
+    def _connect(self) -> None:
+        """Open (or reopen) the database connection"""
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db_inode = os.stat(self.db_path).st_ino
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
+
+    @contextmanager
+    def _writer(self) -> Iterator[None]:
+        """Exclusive write access to the vault, across threads and processes"""
+        with self._lock:
+            self._file_lock.acquire()
+            try:
+                yield
+            finally:
+                self._file_lock.release()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the store lock and run the block in one write transaction"""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                self._freed_blobs.clear()
+                raise
+            self._db.execute("COMMIT")
+
+            # A blob released and re-referenced in the same transaction
+            # (e.g. an overwriting import) is back in blobs; keep its file
+            for blob_hash in self._freed_blobs:
+                live = self._db.execute("SELECT 1 FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+                path = self._blob_file(blob_hash)
+                if live is None and path is not None:
+                    path.unlink()
+            self._freed_blobs.clear()
+
+    # ----- schema and migration -----
+
+    def _migrate_schema(self) -> None:
+        """Bring vault.db up to the latest schema version"""
+        with self._lock:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            for number, step in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+                with self._transaction() as db:
+                    if callable(step):
+                        step(self)
+                    else:
+                        for statement in step.split(";"):
+                            if statement.strip():
+                                db.execute(statement)
+                    db.execute(f"PRAGMA user_version = {number}")
+
+    def _sync_spiral_positions(self) -> None:
+        """
+        Fill S, L, P and K for scrolls that lack them, or for every scroll
+        when the vault was last positioned against another anchor date.
+        """
+        anchor = self.anchor_date.isoformat()
+        row = self._db.execute("SELECT value FROM vault_meta WHERE key = 'anchor_date'").fetchone()
+        where = "" if row is None or row["value"] != anchor else " WHERE K IS NULL"
+        rows = self._db.execute(f"SELECT id, ts FROM scrolls{where}").fetchall()
+
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE scrolls SET S = :S, L = :L, P = :P, K = :K WHERE id = :id",
+                [{**scroll_sky_address(r["ts"], self.anchor_date), "id": r["id"]} for r in rows],
+            )
+            db.execute(
+                "INSERT INTO vault_meta (key, value) VALUES ('anchor_date', ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (anchor,),
+            )
+
+    def _import_index_json(self) -> None:
+        """
+        Move entries from a legacy index.json into vault.db.
+
+        Runs in a single transaction; afterwards index.json is renamed to
+        index.json.migrated so the import never repeats.
+        """
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        with self._transaction():
+            for entry in index.get("scrolls", []):
+                self._insert_entry(entry, self._read_body_file(entry["id"]))
+        self.index_path.rename(self.index_path.with_name("index.json.migrated"))
+
+    # ----- write-ahead journal -----
+
+    def _journal(self, op: str, scroll_id: str, entry: Optional[Dict[str, Any]] = None) -> int:
+        """Durably record an operation before touching scroll files"""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "INSERT INTO journal (op, scroll_id, entry, ts) VALUES (?, ?, ?, ?)",
+                (op, scroll_id, json.dumps(entry) if entry else None, int(time.time())),
+            )
+        return cursor.lastrowid
+
+    def _replay_journal(self) -> None:
+        """
+        Finish or roll back operations interrupted by a crash (caller holds
+        the writer lock, so no other writer is mid-operation).
+
+        A write whose scroll file or blob made it to disk is indexed;
+        otherwise it is dropped. A delete is always completed.
+        """
+        rows = self._db.execute("SELECT * FROM journal ORDER BY seq").fetchall()
+        for row in rows:
+            scroll_path = self._scroll_path(row["scroll_id"])
+            with self._transaction() as db:
+                if row["op"] == "write":
+                    entry = json.loads(row["entry"])
+                    body_md = None
+                    if entry.get("blob"):
+                        blob_path = self._blob_file(entry["blob"])
+                        if blob_path is not None:
+                            entry["path"] = str(blob_path)
+                            body_md = self._read_blob(entry["blob"])
+                    elif scroll_path.exists():
+                        body_md = self._read_body_file(row["scroll_id"])
+                    if body_md is not None:
+                        # Imports journal the manifest's size; trust the body
+                        entry["size_kb"] = round(len(body_md.encode("utf-8")) / 1024, 2)
+                        self._insert_entry(entry, body_md)
+                elif row["op"] == "delete":
+                    if scroll_path.exists():
+                        scroll_path.unlink()
+                    self._remove_entry(row["scroll_id"])
+                db.execute("DELETE FROM journal WHERE seq = ?", (row["seq"],))
+
+        # Temp files left behind by an interrupted atomic_write_text
+        for directory in (self.scroll_dir, self.blob_dir):
+            for tmp in directory.rglob(".*.tmp"):
+                tmp.unlink()
+
+    def _scroll_path(self, scroll_id: str) -> Path:
+        """
+        Location of a scroll file: scrolls/YYYY/MM/<id>.md, from the time
+        encoded in the id. Scrolls of a vault not yet migrated with
+        `vault_tools migrate` are still found flat in scrolls/.
+
+        Raises:
+            FileNotFoundError: If scroll_id is not a valid id
+        """
+        try:
+            shard = scroll_shard(scroll_id)
+        except ValueError:
+            raise FileNotFoundError(f"Scroll not found: {scroll_id}")
+        path = self.scroll_dir / shard / f"{scroll_id}.md"
+        if not path.exists():
+            legacy = self.scroll_dir / f"{scroll_id}.md"
+            if legacy.exists():
+                return legacy
+        return path
+
+    def _read_body_file(self, scroll_id: str) -> str:
+        """Read a scroll body from disk, or "" when the file is missing"""
+        try:
+            scroll_path = self._scroll_path(scroll_id)
+        except FileNotFoundError:
+            return ""
+        return scroll_path.read_text(encoding="utf-8") if scroll_path.exists() else ""
+
+    def _read_body(self, scroll_id: str) -> str:
+        """
+        Read a scroll body from its blob or its scroll file.
+
+        Raises:
+            FileNotFoundError: If the scroll doesn't exist
+        """
+        with self._lock:
+            row = self._db.execute("SELECT blob FROM scrolls WHERE id = ?", (scroll_id,)).fetchone()
+        if row is not None and row["blob"]:
+            return self._read_blob(row["blob"])
+
+        scroll_path = self._scroll_path(scroll_id)
+        if not scroll_path.exists():
+            raise FileNotFoundError(f"Scroll not found: {scroll_id}")
+        return scroll_path.read_text(encoding="utf-8")
+
+    def _cached_bodies(self, scroll_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Bodies for several scrolls, from the body cache where possible and
+        with one metadata query for the rest; missing scrolls are left out.
+        Call after _index() so the cache has been validated.
+        """
+        bodies: Dict[str, str] = {}
+        misses: List[str] = []
+        with self._lock:
+            for scroll_id in scroll_ids:
+                body_md = self._bodies.get(scroll_id)
+                if body_md is None:
+                    misses.append(scroll_id)
+                else:
+                    bodies[scroll_id] = body_md
+        if not misses:
+            return bodies
+
+        blobs: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for start in range(0, len(misses), 500):
+                chunk = misses[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT id, blob FROM scrolls WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                blobs.update((row["id"], row["blob"]) for row in rows)
+
+        for scroll_id in misses:
+            try:
+                if blobs.get(scroll_id):
+                    body_md = self._read_blob(blobs[scroll_id])
+                else:
+                    scroll_path = self._scroll_path(scroll_id)
+                    if not scroll_path.exists():
+                        continue
+                    body_md = scroll_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            bodies[scroll_id] = body_md
+            with self._lock:
+                self._bodies.put(scroll_id, body_md)
+        return bodies
+
+    # ----- content-addressed blobs -----
+
+    def _blob_base(self, blob_hash: str) -> Path:
+        return self.blob_dir / blob_hash[:2] / blob_hash[2:4] / blob_hash
+
+    def _blob_file(self, blob_hash: str) -> Optional[Path]:
+        """Existing file for a blob (plain or compressed), or None"""
+        base = self._blob_base(blob_hash)
+        for path in (base, base.with_name(base.name + _ZLIB_SUFFIX)):
+            if path.exists():
+                return path
+        return None
+
+    def _store_blob(self, body_md: str, durable: bool = True) -> Tuple[str, Path]:
+        """
+        Write a body as a blob unless identical content is already stored
+        (caller holds the writer lock).
+
+        Returns:
+            (sha256 hex digest, blob file path)
+        """
+        data = body_md.encode("utf-8")
+        blob_hash = hashlib.sha256(data).hexdigest()
+        existing = self._blob_file(blob_hash)
+        if existing is not None:
+            return blob_hash, existing
+
+        path = self._blob_base(blob_hash)
+        if len(data) >= self.compress_min_bytes:
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data):
+                data, path = packed, path.with_name(path.name + _ZLIB_SUFFIX)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if durable:
+            atomic_write_bytes(path, data)
+        else:
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return blob_hash, path
+
+    def _read_blob(self, blob_hash: str) -> str:
+        """Read and decompress a blob"""
+        path = self._blob_file(blob_hash)
+        if path is None:
+            raise FileNotFoundError(f"Blob not found: {blob_hash}")
+        data = path.read_bytes()
+        if path.name.endswith(_ZLIB_SUFFIX):
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
 
-        # Create index if it doesn't exist
-        if not self.index_path.exists():
-            self._write_index({"scrolls": []})
+    def _reference_blob(self, blob_hash: str, size_bytes: int) -> None:
+        """Count one more entry using a blob (caller holds a transaction)"""
+        if blob_hash in self._freed_blobs:
+            self._freed_blobs.remove(blob_hash)
+        path = self._blob_file(blob_hash)
+        self._db.execute(
+            "INSERT INTO blobs (hash, refcount, size_bytes, stored_bytes) VALUES (?, 1, ?, ?)"
+            " ON CONFLICT (hash) DO UPDATE SET refcount = refcount + 1",
+            (blob_hash, size_bytes, path.stat().st_size if path else 0),
+        )
 
-    def _read_index(self) -> Dict[str, Any]:
-        """Read the scroll index"""
-        return json.loads(self.index_path.read_text(encoding="utf-8"))
+    def _release_blob(self, blob_hash: str) -> None:
+        """Drop one reference; the last one frees the blob after commit"""
+        self._db.execute("UPDATE blobs SET refcount = refcount - 1 WHERE hash = ?", (blob_hash,))
+        row = self._db.execute("SELECT refcount FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+        if row is not None and row["refcount"] <= 0:
+            self._db.execute("DELETE FROM blobs WHERE hash = ?", (blob_hash,))
+            self._freed_blobs.append(blob_hash)
 
-    def _write_index(self, index: Dict[str, Any]) -> None:
-        """Write the scroll index"""
-        self.index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    def _index_text(self, rowid: int, title: str, tags: List[str], body_md: str) -> None:
+        """Add a scroll to the full-text index under its scrolls rowid"""
+        self._db.execute(
+            "INSERT INTO scroll_fts (rowid, title, tags, body) VALUES (?, ?, ?, ?)",
+            (rowid, title, " ".join(tags), body_md),
+        )
+
+    def _insert_entry(self, entry: Dict[str, Any], body_md: str) -> None:
+        """Insert one metadata entry and index its text (caller holds a transaction)"""
+        self._remove_entry(entry["id"])
+
+        tags = entry.get("tags", [])
+        blob_hash = entry.get("blob")
+        position = scroll_sky_address(entry.get("ts", 0), self.anchor_date)
+        cursor = self._db.execute(
+            "INSERT INTO scrolls (id, title, tags, path, ts, size_kb, blob, S, L, P, K)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry["id"],
+                entry.get("title", ""),
+                json.dumps(tags),
+                entry.get("path", str(self._scroll_path(entry["id"]))),
+                entry.get("ts", 0),
+                entry.get("size_kb", 0),
+                blob_hash,
+                position["S"],
+                position["L"],
+                position["P"],
+                position["K"],
+            ),
+        )
+        if blob_hash:
+            self._reference_blob(blob_hash, len(body_md.encode("utf-8")))
+        self._db.executemany(
+            "INSERT OR IGNORE INTO scroll_tags (tag, scroll_id) VALUES (?, ?)",
+            [(tag, entry["id"]) for tag in tags],
+        )
+        self._index_text(cursor.lastrowid, entry.get("title", ""), tags, body_md)
+
+    def _remove_entry(self, scroll_id: str) -> None:
+        """Drop an entry and its index rows (caller holds a transaction)"""
+        row = self._db.execute("SELECT rowid, blob FROM scrolls WHERE id = ?", (scroll_id,)).fetchone()
+        if row is None:
+            return
+        self._db.execute("DELETE FROM scroll_fts WHERE rowid = ?", (row["rowid"],))
+        # scroll_tags rows cascade
+        self._db.execute("DELETE FROM scrolls WHERE rowid = ?", (row["rowid"],))
+        if row["blob"]:
+            self._release_blob(row["blob"])
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a scrolls row to the metadata entry dict"""
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "tags": json.loads(row["tags"]),
+            "path": row["path"],
+            "ts": row["ts"],
+            "size_kb": row["size_kb"],
+            "S": row["S"],
+            "L": row["L"],
+            "P": row["P"],
+            "K": row["K"],
+        }
+
+    # ----- in-memory index -----
+
+    def _file_signature(self) -> Tuple:
+        """(inode, size, mtime) of vault.db and its WAL, None when missing"""
+        signature = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + "-wal")):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _data_version(self) -> int:
+        """Counter SQLite bumps whenever another connection commits"""
+        return self._db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _index(self) -> IndexSnapshot:
+        """
+        Get the in-memory index, reloading it if the vault changed.
+
+        Changes by other processes are caught by the file signature and by
+        PRAGMA data_version; a replaced vault.db (new inode) also reopens
+        the connection.
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if signature[0] is not None and signature[0][0] != self._db_inode:
+                self._db.close()
+                self._connect()
+                self._snapshot = None
+
+            snapshot = self._snapshot
+            if (
+                snapshot is None
+                or snapshot.signature != signature
+                or snapshot.data_version != self._data_version()
+            ):
+                snapshot = self._snapshot = self._load_index(signature)
+                self._bodies.clear()
+            return snapshot
+
+    def _load_index(self, signature: Tuple) -> IndexSnapshot:
+        """Read every entry into a fresh IndexSnapshot"""
+        snapshot = IndexSnapshot(signature=signature, data_version=self._data_version())
+        rows = self._db.execute("SELECT * FROM scrolls ORDER BY ts DESC, id DESC").fetchall()
+        for row in rows:
+            entry = self._row_to_entry(row)
+            snapshot.entries[entry["id"]] = entry
+            snapshot.order.append(entry["id"])
+        return snapshot
+
+    def _update_index(self, apply: Callable[[IndexSnapshot], Optional[bool]]) -> None:
+        """Apply our own committed change to the in-memory index"""
+        with self._lock:
+            if self._snapshot is None:
+                return
+            if apply(self._snapshot) is False:
+                self._snapshot = None
+                return
+            # Our own commit moved the files; data_version is left as loaded
+            # so commits by other processes still trigger a reload
+            self._snapshot.signature = self._file_signature()
+
+    def _get_entry(self, scroll_id: str) -> Optional[Dict[str, Any]]:
+        """Look up one metadata entry by id"""
+        entry = self._index().entries.get(scroll_id)
+        return _copy_entry(entry) if entry else None
+
+    # ----- public API -----
 
     def write_scroll(
         self, title: str, body_md: str, tags: Optional[List[str]] = None
@@ -67,17 +1058,10 @@ class VaultStore:
                 f"Scroll exceeds size limit: {body_size_kb:.1f}KB > {self.max_scroll_kb}KB"
             )
 
-        # Generate unique scroll ID
-        timestamp = int(time.time())
-        hash_suffix = abs(hash(title)) % 99999
-        scroll_id = f"{timestamp}-{hash_suffix:05d}"
-
-        # Write scroll file
-        scroll_path = self.scroll_dir / f"{scroll_id}.md"
-        scroll_path.write_text(body_md, encoding="utf-8")
-
-        # Update index
-        index = self._read_index()
+        # Generate unique, time-sortable scroll ID
+        scroll_id = self.ids.new_id()
+        scroll_path = self.scroll_dir / scroll_shard(scroll_id) / f"{scroll_id}.md"
+        timestamp = int(scroll_id_timestamp(scroll_id))
         entry = {
             "id": scroll_id,
             "title": title,
@@ -85,9 +1069,25 @@ class VaultStore:
             "path": str(scroll_path),
             "ts": timestamp,
             "size_kb": round(body_size_kb, 2),
+            **scroll_sky_address(timestamp, self.anchor_date),
         }
-        index["scrolls"].append(entry)
-        self._write_index(index)
+
+        # Journal, write the body atomically, then index and clear the journal
+        with self._writer():
+            record = dict(entry)
+            if self.blob_store:
+                record["blob"] = hashlib.sha256(body_md.encode("utf-8")).hexdigest()
+            seq = self._journal("write", scroll_id, record)
+            if self.blob_store:
+                _, blob_path = self._store_blob(body_md)
+                entry["path"] = record["path"] = str(blob_path)
+            else:
+                scroll_path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_text(scroll_path, body_md)
+            with self._transaction() as db:
+                self._insert_entry(record, body_md)
+                db.execute("DELETE FROM journal WHERE seq = ?", (seq,))
+            self._update_index(lambda index: index.add(_copy_entry(entry)))
 
         return entry
 
@@ -104,55 +1104,181 @@ class VaultStore:
         Raises:
             FileNotFoundError: If scroll doesn't exist
         """
-        scroll_path = self.scroll_dir / f"{scroll_id}.md"
-        if not scroll_path.exists():
+        metadata = self._get_entry(scroll_id)
+        body_md = self._cached_bodies([scroll_id]).get(scroll_id)
+        if body_md is None:
             raise FileNotFoundError(f"Scroll not found: {scroll_id}")
 
-        body_md = scroll_path.read_text(encoding="utf-8")
-
-        # Find metadata in index
-        index = self._read_index()
-        metadata = None
-        for s in index["scrolls"]:
-            if s["id"] == scroll_id:
-                metadata = s
-                break
-
         return {
             "id": scroll_id,
             "body_md": body_md,
             "metadata": metadata,
         }
 
+    def read_scrolls(self, scroll_ids: List[str]) -> Dict[str, Any]:
+        """
+        Read several scrolls with one index lookup.
+
+        Args:
+            scroll_ids: Scroll identifiers; duplicates are read once
+
+        Returns:
+            Dictionary with:
+            - scrolls: read_scroll results, in the order requested
+            - missing: ids that don't exist
+        """
+        index = self._index()
+        unique = list(dict.fromkeys(scroll_ids))
+        bodies = self._cached_bodies(unique)
+
+        scrolls = []
+        for scroll_id in unique:
+            if scroll_id in bodies:
+                entry = index.entries.get(scroll_id)
+                scrolls.append({
+                    "id": scroll_id,
+                    "body_md": bodies[scroll_id],
+                    "metadata": _copy_entry(entry) if entry else None,
+                })
+        return {
+            "scrolls": scrolls,
+            "missing": [scroll_id for scroll_id in unique if scroll_id not in bodies],
+        }
+
     def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Search scrolls by title or tags.
+        Full-text search over scroll titles, tags and bodies.
+
+        Every word in the query must match, as a prefix ("read" finds
+        "reading"); title hits outrank tag hits, which outrank body hits.
 
         Args:
             query: Search query string
             limit: Maximum number of results
 
         Returns:
-            List of matching scroll metadata entries (most recent first)
+            List of matching scroll metadata entries, best match first,
+            each with a BM25 "score" and a body "snippet"
+        """
+        terms = _QUERY_TOKEN.findall(query.lower())
+        if not terms:
+            return self.list_all(limit)
+        return self.search_page(query, limit)["items"]
+
+    def search_page(
+        self,
+        query: str,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """
+        One page of full-text search results.
+
+        Args:
+            query: Search query string; an empty query lists scrolls instead
+            limit: Page size
+            cursor: next_cursor from the previous page
+            **filters: tag, since, until, min_size_kb, max_size_kb as in list_page
+
+        Returns:
+            {"items": [...], "next_cursor": str or None}, best match first
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        terms = _QUERY_TOKEN.findall(query.lower())
+        if not terms:
+            return self.list_page(limit, cursor, **filters)
+
+        clauses, params = _filter_clauses(**filters)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        after = ""
+        if cursor is not None:
+            rank, rowid = decode_cursor("search", cursor)
+            after = " WHERE (rank, rid) > (?, ?)"
+            params += [rank, rowid]
+
+        match = " ".join(f'"{term}"*' for term in terms)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM ("
+                " SELECT s.*, s.rowid AS rid, bm25(scroll_fts, ?, ?, ?) AS rank,"
+                " snippet(scroll_fts, 2, '**', '**', '…', 12) AS snippet"
+                " FROM scroll_fts JOIN scrolls s ON s.rowid = scroll_fts.rowid"
+                f" WHERE scroll_fts MATCH ?{where}"
+                f"){after} ORDER BY rank, rid LIMIT ?",
+                (*FTS_WEIGHTS, match, *params, limit + 1),
+            ).fetchall()
+
+        items = []
+        for row in rows[:limit]:
+            entry = self._row_to_entry(row)
+            entry["score"] = round(-row["rank"], 4)
+            entry["snippet"] = row["snippet"]
+            items.append(entry)
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor("search", last["rank"], last["rid"])
+        return {"items": items, "next_cursor": next_cursor}
+
+    def list_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_size_kb: Optional[float] = None,
+        max_size_kb: Optional[float] = None,
+        S: Optional[int] = None,
+        L: Optional[int] = None,
+        P: Optional[int] = None,
+        K: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        index = self._read_index()
-        query_lower = query.lower().strip()
-        results = []
+        One page of scrolls in reverse chronological order.
+
+        Pages are keyset-paginated on (ts, id), so each costs O(limit)
+        regardless of vault size or page number.
 
-        # Search in reverse chronological order
-        for scroll in reversed(index["scrolls"]):
-            # Build searchable text from title and tags
-            haystack = (
-                scroll.get("title", "") + " " + " ".join(scroll.get("tags", []))
-            ).lower()
+        Args:
+            limit: Page size
+            cursor: next_cursor from the previous page
+            tag: Only scrolls carrying this tag
+            since: Only scrolls written at or after this unix time
+            until: Only scrolls written before this unix time
+            min_size_kb: Only scrolls at least this large
+            max_size_kb: Only scrolls at most this large
+            S, L, P, K: Only scrolls written on days with this solar key,
+                lunar pattern, gate or spiral position
+
+        Returns:
+            {"items": [...], "next_cursor": str or None}
 
-            if query_lower in haystack:
-                results.append(scroll)
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        clauses, params = _filter_clauses(tag, since, until, min_size_kb, max_size_kb, S, L, P, K)
+        if cursor is not None:
+            ts, scroll_id = decode_cursor("list", cursor)
+            clauses.append("(s.ts, s.id) < (?, ?)")
+            params += [ts, scroll_id]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
 
-            if len(results) >= limit:
-                break
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT s.* FROM scrolls s{where} ORDER BY s.ts DESC, s.id DESC LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
 
-        return results
+        items = [self._row_to_entry(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor("list", items[-1]["ts"], items[-1]["id"])
+        return {"items": items, "next_cursor": next_cursor}
 
     def list_all(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -164,11 +1290,47 @@ class VaultStore:
         Returns:
             List of scroll metadata entries
         """
-        index = self._read_index()
-        scrolls = list(reversed(index["scrolls"]))
-        if limit is not None:
-            scrolls = scrolls[:limit]
-        return scrolls
+        index = self._index()
+        ids = index.order if limit is None else index.order[:limit]
+        return [_copy_entry(index.entries[scroll_id]) for scroll_id in ids]
+
+    def find_by_position(
+        self,
+        K: Optional[int] = None,
+        S: Optional[int] = None,
+        L: Optional[int] = None,
+        P: Optional[int] = None,
+        on_date: Optional[date] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Scrolls written at a spiral position, newest first.
+
+        Args:
+            K: Exact spiral position (0-1000)
+            S: Solar key (1-11)
+            L: Lunar pattern (1-13)
+            P: Gate / prime day (1-7)
+            on_date: Shorthand for the K of this date
+            limit: Page size
+            cursor: next_cursor from the previous page
+
+        Returns:
+            {"items": [...], "next_cursor": str or None}
+
+        Raises:
+            ValueError: If no position is given or one is out of range
+        """
+        if on_date is not None:
+            K = sky_address(on_date, self.anchor_date)[3]
+        for name, value, high in (("K", K, SPIRAL_DAYS - 1), ("S", S, 11), ("L", L, 13), ("P", P, 7)):
+            low = 0 if name == "K" else 1
+            if value is not None and not low <= value <= high:
+                raise ValueError(f"{name} out of range: {low}-{high}")
+        if K is None and S is None and L is None and P is None:
+            raise ValueError("Give at least one of K, S, L, P or a date")
+        return self.list_page(limit, cursor, S=S, L=L, P=P, K=K)
 
     def delete_scroll(self, scroll_id: str) -> None:
         """
@@ -180,30 +1342,391 @@ class VaultStore:
         Raises:
             FileNotFoundError: If scroll doesn't exist
         """
-        scroll_path = self.scroll_dir / f"{scroll_id}.md"
-        if not scroll_path.exists():
-            raise FileNotFoundError(f"Scroll not found: {scroll_id}")
+        scroll_path = self._scroll_path(scroll_id)
+        with self._writer():
+            indexed = self._db.execute("SELECT 1 FROM scrolls WHERE id = ?", (scroll_id,)).fetchone()
+            if indexed is None and not scroll_path.exists():
+                raise FileNotFoundError(f"Scroll not found: {scroll_id}")
 
-        # Delete file
-        scroll_path.unlink()
+            seq = self._journal("delete", scroll_id)
+            if scroll_path.exists():
+                scroll_path.unlink()
+            with self._transaction() as db:
+                self._remove_entry(scroll_id)
+                db.execute("DELETE FROM journal WHERE seq = ?", (seq,))
+            self._update_index(lambda index: index.remove(scroll_id))
+            self._bodies.discard(scroll_id)
 
-        # Remove from index
-        index = self._read_index()
-        index["scrolls"] = [s for s in index["scrolls"] if s["id"] != scroll_id]
-        self._write_index(index)
+    def migrate_layout(self) -> int:
+        """
+        Move flat scrolls/<id>.md files into the sharded layout and update
+        their stored paths. Safe to re-run; files with ids the layout cannot
+        place are left where they are.
+
+        Returns:
+            Number of scrolls moved
+        """
+        moved = 0
+        with self._writer():
+            for legacy in sorted(self.scroll_dir.glob("*.md")):
+                scroll_id = legacy.stem
+                try:
+                    target = self.scroll_dir / scroll_shard(scroll_id) / legacy.name
+                except ValueError:
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(legacy, target)
+                _fsync_dir(target.parent)
+                with self._transaction() as db:
+                    db.execute("UPDATE scrolls SET path = ? WHERE id = ?", (str(target), scroll_id))
+                moved += 1
+            _fsync_dir(self.scroll_dir)
+            self._snapshot = None
+        return moved
 
-    def get_stats(self) -> Dict[str, Any]:
+    def check(self) -> Dict[str, List[str]]:
+        """
+        Verify that the index and the files on disk agree.
+
+        Returns:
+            Dictionary with:
+            - missing_bodies: indexed scroll ids whose blob or file is gone
+            - orphan_blobs: blob files no index row references
+        """
+        with self._writer():
+            rows = self._db.execute("SELECT id, blob FROM scrolls").fetchall()
+            known = {row["hash"] for row in self._db.execute("SELECT hash FROM blobs")}
+
+        missing = []
+        for row in rows:
+            if row["blob"]:
+                present = self._blob_file(row["blob"]) is not None
+            else:
+                try:
+                    present = self._scroll_path(row["id"]).exists()
+                except FileNotFoundError:
+                    present = False
+            if not present:
+                missing.append(row["id"])
+
+        orphans = []
+        if self.blob_dir.exists():
+            for path in sorted(self.blob_dir.glob("*/*/*")):
+                if path.name.startswith("."):
+                    continue
+                if path.name.removesuffix(_ZLIB_SUFFIX) not in known:
+                    orphans.append(path.name.removesuffix(_ZLIB_SUFFIX))
+        return {"missing_bodies": missing, "orphan_blobs": orphans}
+
+    def pack_blobs(self) -> Dict[str, int]:
+        """
+        Move scrolls stored as individual files into the blob store
+        (deduplicated and compressed), one scroll per transaction.
+
+        Returns:
+            {"packed": n, "blobs": distinct blobs now stored}
+        """
+        packed = 0
+        with self._writer():
+            rows = self._db.execute("SELECT id FROM scrolls WHERE blob IS NULL").fetchall()
+            for row in rows:
+                scroll_path = self._scroll_path(row["id"])
+                if not scroll_path.exists():
+                    continue
+                body_md = scroll_path.read_text(encoding="utf-8")
+                blob_hash, blob_path = self._store_blob(body_md)
+                with self._transaction() as db:
+                    db.execute(
+                        "UPDATE scrolls SET blob = ?, path = ? WHERE id = ?",
+                        (blob_hash, str(blob_path), row["id"]),
+                    )
+                    self._reference_blob(blob_hash, len(body_md.encode("utf-8")))
+                scroll_path.unlink()
+                packed += 1
+            self._snapshot = None
+            blobs = self._db.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return {"packed": packed, "blobs": blobs}
+
+    # ----- bulk export / import -----
+
+    def export_archive(self, target: Union[Path, BinaryIO], **filters: Any) -> int:
+        """
+        Export scrolls as a streamed tar.gz archive.
+
+        The archive starts with manifest.json (format, version and every
+        exported metadata entry), followed by one scrolls/YYYY/MM/<id>.md
+        member per scroll, so it can be imported in a single pass.
+
+        Args:
+            target: Output path or writable binary stream (e.g. stdout)
+            **filters: tag, since, until, min_size_kb, max_size_kb as in list_page
+
+        Returns:
+            Number of scrolls exported
+        """
+        clauses, params = _filter_clauses(**filters)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT s.* FROM scrolls s{where} ORDER BY s.ts, s.id", params
+            ).fetchall()
+        entries = [self._row_to_entry(row) for row in rows]
+
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "exported_at": int(time.time()),
+            "count": len(entries),
+            "scrolls": [{k: v for k, v in entry.items() if k != "path"} for entry in entries],
+        }
+
+        def add(archive: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+
+        if isinstance(target, (str, Path)):
+            archive = tarfile.open(target, mode="w:gz")
+        else:
+            archive = tarfile.open(fileobj=target, mode="w|gz")
+        with archive:
+            add(archive, ARCHIVE_MANIFEST, json.dumps(manifest).encode("utf-8"), manifest["exported_at"])
+            for entry in entries:
+                try:
+                    body = self._read_body(entry["id"]).encode("utf-8")
+                except FileNotFoundError:
+                    body = b""
+                name = f"scrolls/{scroll_shard(entry['id'])}/{entry['id']}.md"
+                add(archive, name, body, entry["ts"])
+        return len(entries)
+
+    def import_archive(self, source: Union[Path, BinaryIO], overwrite: bool = False) -> Dict[str, int]:
+        """
+        Import an archive written by export_archive.
+
+        Bodies are streamed to disk as the archive is read, a batch at a
+        time, without a per-file fsync, and all entries are indexed in one
+        transaction. Sizes come from the bodies themselves, not the
+        manifest. The import is journaled like single writes, so a crash
+        part-way through is finished on the next start.
+
+        Args:
+            source: Archive path or readable binary stream (e.g. stdin)
+            overwrite: Replace scrolls whose id already exists (default: skip them)
+
+        Returns:
+            {"imported": n, "skipped": n}
+
+        Raises:
+            ValueError: If the archive is not a vault export, or a scroll in
+                it exceeds the size limit (nothing is imported)
+        """
+        if isinstance(source, (str, Path)):
+            archive = tarfile.open(source, mode="r:gz")
+        else:
+            archive = tarfile.open(fileobj=source, mode="r|gz")
+
+        with archive, self._writer():
+            first = archive.next()
+            if first is None or first.name != ARCHIVE_MANIFEST:
+                raise ValueError("Not a vault archive: manifest.json must come first")
+            manifest = json.loads(archive.extractfile(first).read())
+            if manifest.get("format") != ARCHIVE_FORMAT or manifest.get("version") != ARCHIVE_VERSION:
+                raise ValueError("Unsupported vault archive format")
+
+            existing = set(self._index().entries)
+            pending: Dict[str, Dict[str, Any]] = {}
+            skipped = 0
+            for entry in manifest.get("scrolls", []):
+                try:
+                    shard = scroll_shard(entry["id"])
+                except (KeyError, ValueError):
+                    raise ValueError(f"Invalid scroll id in archive: {entry.get('id')}")
+                if entry["id"] in existing and not overwrite:
+                    skipped += 1
+                    continue
+                path = self.scroll_dir / shard / f"{entry['id']}.md"
+                pending[entry["id"]] = {
+                    **{k: v for k, v in entry.items() if k != "blob"},
+                    "path": str(path),
+                }
+
+            with self._transaction() as db:
+                db.executemany(
+                    "INSERT INTO journal (op, scroll_id, entry, ts) VALUES ('write', ?, ?, ?)",
+                    [(i, json.dumps(e), int(time.time())) for i, e in pending.items()],
+                )
+
+            # Member names are only used to look up the manifest entry;
+            # files are always placed by id. Only one batch of bodies is
+            # held in memory at a time.
+            staged: Dict[str, Path] = {}
+            created: List[Path] = []
+            batch: List[Tuple[str, str]] = []
+            try:
+                for member in archive:
+                    if not member.isfile() or not member.name.endswith(".md"):
+                        continue
+                    scroll_id = Path(member.name).stem
+                    if scroll_id not in pending:
+                        continue
+                    body_size_kb = member.size / 1024
+                    if body_size_kb > self.max_scroll_kb:
+                        raise ValueError(
+                            f"Scroll {scroll_id} exceeds size limit:"
+                            f" {body_size_kb:.1f}KB > {self.max_scroll_kb}KB"
+                        )
+                    body_md = archive.extractfile(member).read().decode("utf-8")
+                    pending[scroll_id]["size_kb"] = round(body_size_kb, 2)
+                    batch.append((scroll_id, body_md))
+                    if len(batch) >= IMPORT_BATCH:
+                        self._stage_import(batch, pending, staged, created)
+                        batch = []
+                self._stage_import(batch, pending, staged, created)
+            except BaseException:
+                for path in created:
+                    path.unlink(missing_ok=True)
+                with self._transaction() as db:
+                    db.executemany(
+                        "DELETE FROM journal WHERE op = 'write' AND scroll_id = ?",
+                        [(scroll_id,) for scroll_id in pending],
+                    )
+                raise
+
+            # Scroll files go into place only once the whole archive is read
+            if not self.blob_store:
+                for scroll_id, tmp in staged.items():
+                    os.replace(tmp, pending[scroll_id]["path"])
+
+            # One flush for the whole batch instead of an fsync per file
+            if hasattr(os, "sync"):
+                os.sync()
+            for directory in {Path(pending[i]["path"]).parent for i in staged}:
+                _fsync_dir(directory)
+
+            # Bodies are read back one at a time for the full-text index
+            with self._transaction() as db:
+                for scroll_id in staged:
+                    entry = pending[scroll_id]
+                    if self.blob_store:
+                        body_md = self._read_blob(entry["blob"])
+                    else:
+                        body_md = Path(entry["path"]).read_text(encoding="utf-8")
+                    self._insert_entry(entry, body_md)
+                db.executemany(
+                    "DELETE FROM journal WHERE op = 'write' AND scroll_id = ?",
+                    [(scroll_id,) for scroll_id in pending],
+                )
+            self._snapshot = None
+
+        return {"imported": len(staged), "skipped": skipped + len(pending) - len(staged)}
+
+    def _stage_import(
+        self,
+        batch: List[Tuple[str, str]],
+        pending: Dict[str, Dict[str, Any]],
+        staged: Dict[str, Path],
+        created: List[Path],
+    ) -> None:
+        """
+        Write one batch of imported bodies (caller holds the writer lock).
+
+        Scroll files are written under a temporary name for import_archive
+        to move into place. Blob hashes are journaled before the blobs are
+        stored, so replay can index a blob written just before a crash.
+        Every file this creates is added to created.
+        """
+        if not batch:
+            return
+        if not self.blob_store:
+            for scroll_id, body_md in batch:
+                path = Path(pending[scroll_id]["path"])
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f".{path.name}.import.tmp")
+                created.append(tmp)
+                tmp.write_text(body_md, encoding="utf-8")
+                staged[scroll_id] = tmp
+            return
+
+        for scroll_id, body_md in batch:
+            pending[scroll_id]["blob"] = hashlib.sha256(body_md.encode("utf-8")).hexdigest()
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE journal SET entry = ? WHERE op = 'write' AND scroll_id = ?",
+                [(json.dumps(pending[scroll_id]), scroll_id) for scroll_id, _ in batch],
+            )
+        for scroll_id, body_md in batch:
+            entry = pending[scroll_id]
+            is_new = self._blob_file(entry["blob"]) is None
+            _, blob_path = self._store_blob(body_md, durable=False)
+            if is_new:
+                created.append(blob_path)
+            entry["path"] = str(blob_path)
+            staged[scroll_id] = blob_path
+
+    def get_stats(
+        self, facets: bool = False, top_tags: int = 20, days: int = 30
+    ) -> Dict[str, Any]:
         """
         Get Vault statistics.
 
+        Totals and facets come from aggregate tables maintained on every
+        write and delete, so this never scans the scrolls.
+
+        Args:
+            facets: Include per-tag, per-day and per-month breakdowns
+            top_tags: Number of most-used tags in the tag facet
+            days: Number of most recent days (with scrolls) in the day facet
+
         Returns:
             Dictionary with scroll count, total size, etc.
         """
-        index = self._read_index()
-        total_size_kb = sum(s.get("size_kb", 0) for s in index["scrolls"])
+        with self._lock:
+            totals = self._db.execute("SELECT * FROM stats_totals").fetchone()
 
-        return {
-            "scroll_count": len(index["scrolls"]),
-            "total_size_kb": round(total_size_kb, 2),
-            "vault_path": str(self.root),
+            stats: Dict[str, Any] = {
+                "scroll_count": totals["scroll_count"],
+                "total_size_kb": round(totals["total_size_kb"], 2),
+                "vault_path": str(self.root),
+                "blob_count": totals["blob_count"],
+                "blob_stored_kb": round(totals["blob_stored_bytes"] / 1024, 2),
+            }
+            if not facets:
+                return stats
+
+            tag_rows = self._db.execute(
+                "SELECT tag, scroll_count FROM stats_tags ORDER BY scroll_count DESC, tag LIMIT ?",
+                (top_tags,),
+            ).fetchall()
+            day_rows = self._db.execute(
+                "SELECT day, scroll_count, size_kb FROM stats_days ORDER BY day DESC LIMIT ?",
+                (days,),
+            ).fetchall()
+            month_rows = self._db.execute(
+                "SELECT substr(day, 1, 7) AS month, SUM(scroll_count) AS n, SUM(size_kb) AS kb"
+                " FROM stats_days GROUP BY month ORDER BY month DESC"
+            ).fetchall()
+            tag_count = self._db.execute("SELECT COUNT(*) FROM stats_tags").fetchone()[0]
+            gate_rows = self._db.execute(
+                "SELECT gate, scroll_count FROM stats_gates ORDER BY gate"
+            ).fetchall()
+
+        stats["facets"] = {
+            "tag_count": tag_count,
+            "tags": {row["tag"]: row["scroll_count"] for row in tag_rows},
+            "days": {
+                row["day"]: {"scroll_count": row["scroll_count"], "size_kb": round(row["size_kb"], 2)}
+                for row in day_rows
+            },
+            "months": {
+                row["month"]: {"scroll_count": row["n"], "size_kb": round(row["kb"], 2)}
+                for row in month_rows
+            },
+            "gates": {
+                row["gate"]: {"name": GATE_NAMES.get(row["gate"]), "scroll_count": row["scroll_count"]}
+                for row in gate_rows
+            },
         }
+        return stats
@@ -0,0 +1,173 @@
+"""
+Tower 6 Vault Tools - maintenance commands for a Vault directory
+
+Usage:
+    python -m tower6_bridge.vault_tools [--vault DIR] migrate
+    python -m tower6_bridge.vault_tools [--vault DIR] export ARCHIVE [--tag TAG] [--since DATE] [--until DATE]
+    python -m tower6_bridge.vault_tools [--vault DIR] import ARCHIVE [--overwrite]
+    python -m tower6_bridge.vault_tools [--vault DIR] pack
+    python -m tower6_bridge.vault_tools [--vault DIR] check
+
+--vault defaults to $VAULT_DIR or ./vault. ARCHIVE may be "-" for stdout/stdin.
+
+Stored. Retrievable. Kind.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from tower6_bridge.vault_store import VaultStore
+
+
+# At least nine digits, so years and compact dates are never read as timestamps
+_TIMESTAMP = re.compile(r"\d{9,}(\.\d+)?")
+
+
+def _unix_time(value: str, end_of_day: bool = False) -> float:
+    """
+    Unix time for YYYY-MM-DD (UTC) or a unix timestamp. A date used as
+    an upper bound covers that whole day, as in the vault MCP tools.
+    """
+    if _TIMESTAMP.fullmatch(value):
+        return float(value)
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value} (use YYYY-MM-DD or a unix timestamp)")
+    if end_of_day:
+        day += timedelta(days=1)
+    return day.timestamp()
+
+
+def _since_time(value: str) -> float:
+    """argparse type for --since: start of the named day"""
+    return _unix_time(value)
+
+
+def _until_time(value: str) -> float:
+    """argparse type for --until: end of the named day"""
+    return _unix_time(value, end_of_day=True)
+
+
+def cmd_migrate(store: VaultStore, args: argparse.Namespace) -> int:
+    """Upgrade the schema and move flat scroll files into the sharded layout"""
+    moved = store.migrate_layout()
+    print(f"Migrated {store.root}: moved {moved} scroll(s) into scrolls/YYYY/MM/")
+    return 0
+
+
+def cmd_export(store: VaultStore, args: argparse.Namespace) -> int:
+    """Write scrolls (optionally filtered) to a tar.gz archive"""
+    filters = {"tag": args.tag, "since": args.since, "until": args.until}
+    if args.archive == "-":
+        count = store.export_archive(sys.stdout.buffer, **filters)
+    else:
+        count = store.export_archive(Path(args.archive), **filters)
+    print(f"Exported {count} scroll(s) to {args.archive}", file=sys.stderr)
+    return 0
+
+
+def cmd_import(store: VaultStore, args: argparse.Namespace) -> int:
+    """Load scrolls from an archive made by export"""
+    source = sys.stdin.buffer if args.archive == "-" else Path(args.archive)
+    result = store.import_archive(source, overwrite=args.overwrite)
+    print(
+        f"Imported {result['imported']} scroll(s) into {store.root}"
+        f" ({result['skipped']} skipped)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_pack(store: VaultStore, args: argparse.Namespace) -> int:
+    """Move per-file scroll bodies into the content-addressed blob store"""
+    result = store.pack_blobs()
+    print(f"Packed {result['packed']} scroll(s) into {result['blobs']} blob(s)")
+    return 0
+
+
+def cmd_check(store: VaultStore, args: argparse.Namespace) -> int:
+    """Report scrolls whose body is missing and unreferenced blob files"""
+    result = store.check()
+    for scroll_id in result["missing_bodies"]:
+        print(f"missing body: {scroll_id}")
+    for blob_hash in result["orphan_blobs"]:
+        print(f"orphan blob: {blob_hash}")
+    problems = len(result["missing_bodies"]) + len(result["orphan_blobs"])
+    print(f"Checked {store.root}: {problems} problem(s)", file=sys.stderr)
+    return 1 if problems else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m tower6_bridge.vault_tools",
+        description="Maintenance commands for a Tower 6 Vault",
+    )
+    parser.add_argument(
+        "--vault",
+        type=Path,
+        default=Path(os.getenv("VAULT_DIR", "./vault")),
+        help="Vault directory (default: $VAULT_DIR or ./vault)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = commands.add_parser(
+        "migrate", help="upgrade vault.db and move scrolls into the sharded layout"
+    )
+    migrate.set_defaults(func=cmd_migrate)
+
+    export = commands.add_parser("export", help="export scrolls to a tar.gz archive")
+    export.add_argument("archive", help="output file, or - for stdout")
+    export.add_argument("--tag", help="only scrolls with this tag")
+    export.add_argument("--since", type=_since_time, help="only scrolls written on/after (YYYY-MM-DD)")
+    export.add_argument("--until", type=_until_time, help="only scrolls written on/before (YYYY-MM-DD)")
+    export.set_defaults(func=cmd_export)
+
+    restore = commands.add_parser("import", help="import scrolls from an export archive")
+    restore.add_argument("archive", help="input file, or - for stdin")
+    restore.add_argument(
+        "--overwrite", action="store_true", help="replace scrolls whose id already exists"
+    )
+    restore.set_defaults(func=cmd_import)
+
+    pack = commands.add_parser(
+        "pack", help="move scroll files into the deduplicated, compressed blob store"
+    )
+    pack.set_defaults(func=cmd_pack)
+
+    check = commands.add_parser(
+        "check", help="verify every indexed scroll has its body and no blob is orphaned"
+    )
+    check.set_defaults(func=cmd_check)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a vault maintenance command"""
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+
+    # Opening the store applies schema migrations and replays the journal
+    store = VaultStore(
+        root=args.vault,
+        blob_store=os.getenv("VAULT_BLOBS", "0") not in ("0", "false", "no", "off"),
+        compress_min_bytes=int(os.getenv("VAULT_COMPRESS_MIN_BYTES", "4096")),
+        anchor_date=date.fromisoformat(os.getenv("ATLAS_ANCHOR_DATE", "2025-04-03")),
+    )
+    try:
+        return args.func(store, args)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())